@@ -2,99 +2,119 @@
 """
 Performance benchmark script to compare caching vs non-caching performance
 """
-import subprocess
-import json
+import contextlib
 import time
+import click
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from colorama import Fore, Style, init
+from src.config import Config
+from src.orchestrator import DocumentVerificationOrchestrator
+from src.table_viewer import load_and_display_results
 
 init(autoreset=True)
 
-def run_verification(enable_cache=True, session_suffix=""):
+def create_orchestrator(enable_cache=True, verbose=False):
+    """Build an orchestrator with or without caching"""
+    config = Config(enable_caching=enable_cache, verbose=verbose)
+    Path(config.results_dir).mkdir(parents=True, exist_ok=True)
+    return DocumentVerificationOrchestrator(config)
+
+def run_verification(enable_cache=True, session_suffix="", verbose=False, orchestrator=None):
     """Run verification with or without caching"""
-    cache_flag = "" if enable_cache else "--no-cache"
     session_id = f"benchmark-{'cached' if enable_cache else 'uncached'}-{session_suffix}"
 
-    cmd = [
-        "python", "main.py", "verify",
-        "--session-id", session_id,
-        "--verbose"
-    ]
-    if not enable_cache:
-        cmd.append("--no-cache")
-
     print(f"{Fore.CYAN}Running verification with caching {'ENABLED' if enable_cache else 'DISABLED'}...{Style.RESET_ALL}")
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=1800)  # 30 min timeout
-        end_time = time.time()
-
-        if result.returncode == 0:
-            # Load result file to get performance metrics
-            results_path = f"./results/{session_id}.json"
-            if Path(results_path).exists():
-                with open(results_path, 'r') as f:
-                    data = json.load(f)
-                return {
-                    "success": True,
-                    "total_time": end_time - start_time,
-                    "claims_processed": data.get("performance", {}).get("claims_processed", 0),
-                    "avg_time_per_claim": data.get("performance", {}).get("avg_time_per_claim", 0),
-                    "session_id": session_id,
-                    "stdout": result.stdout,
-                    "stderr": result.stderr
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": "Result file not found",
-                    "stdout": result.stdout,
-                    "stderr": result.stderr
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Process failed with code {result.returncode}",
-                "stdout": result.stdout,
-                "stderr": result.stderr
-            }
-    except subprocess.TimeoutExpired:
+        if orchestrator is None:
+            orchestrator = create_orchestrator(enable_cache, verbose)
+        _, data = orchestrator.verify_document(session_id)
+        end_time = time.perf_counter()
+        # The result table is read back from disk later
+        orchestrator.flush()
+    except Exception as e:
         return {
             "success": False,
-            "error": "Process timed out after 30 minutes"
+            "error": f"Verification raised {type(e).__name__}: {e}"
         }
 
-def main():
-    print(f"{Fore.GREEN}{'='*60}")
-    print(f"Strands Document Verifier Performance Benchmark")
-    print(f"{'='*60}{Style.RESET_ALL}")
+    if "error" in data:
+        return {
+            "success": False,
+            "error": data["error"]
+        }
 
-    timestamp = int(time.time())
+    return {
+        "success": True,
+        "total_time": end_time - start_time,
+        "claims_processed": data.get("performance", {}).get("claims_processed", 0),
+        "avg_time_per_claim": data.get("performance", {}).get("avg_time_per_claim", 0),
+        "session_id": session_id
+    }
+
+def run_phases(parallel, session_suffix, verbose=False):
+    """Run the cached and uncached phases, returning both results"""
+    if parallel:
+        # Both orchestrators (and their Bedrock clients on the shared boto3 session) are
+        # built here on the main thread; only the Bedrock-bound verifications run side by side
+        try:
+            cached_orchestrator = create_orchestrator(enable_cache=True, verbose=verbose)
+            uncached_orchestrator = create_orchestrator(enable_cache=False, verbose=verbose)
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Setup raised {type(e).__name__}: {e}"
+            }, None
 
-    # Run with caching enabled
-    print(f"\n{Fore.YELLOW}Phase 1: Running with CACHING ENABLED{Style.RESET_ALL}")
-    cached_result = run_verification(enable_cache=True, session_suffix=str(timestamp))
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cached_future = executor.submit(run_verification, enable_cache=True, session_suffix=session_suffix,
+                                            verbose=verbose, orchestrator=cached_orchestrator)
+            uncached_future = executor.submit(run_verification, enable_cache=False, session_suffix=session_suffix,
+                                              verbose=verbose, orchestrator=uncached_orchestrator)
+            return cached_future.result(), uncached_future.result()
 
+    print(f"\n{Fore.YELLOW}Phase 1: Running with CACHING ENABLED{Style.RESET_ALL}")
+    cached_result = run_verification(enable_cache=True, session_suffix=session_suffix, verbose=verbose)
     if not cached_result["success"]:
-        print(f"{Fore.RED}Cached run failed: {cached_result['error']}{Style.RESET_ALL}")
-        print(f"STDOUT: {cached_result.get('stdout', '')}")
-        print(f"STDERR: {cached_result.get('stderr', '')}")
-        return
-
-    # Wait a bit to ensure cache expiry (if needed)
-    print(f"\n{Fore.YELLOW}Waiting 10 seconds before uncached run...{Style.RESET_ALL}")
-    time.sleep(10)
+        return cached_result, None
 
-    # Run with caching disabled
     print(f"\n{Fore.YELLOW}Phase 2: Running with CACHING DISABLED{Style.RESET_ALL}")
-    uncached_result = run_verification(enable_cache=False, session_suffix=str(timestamp))
+    return cached_result, run_verification(enable_cache=False, session_suffix=session_suffix, verbose=verbose)
+
+@click.command()
+@click.option('--parallel/--serial', default=False,
+              help='Run the cached and uncached phases concurrently (default: one after another)')
+@click.option('--verbose', '-v', is_flag=True, help='Stream verification output instead of capturing it')
+def main(parallel, verbose):
+    print(f"{Fore.GREEN}{'='*60}")
+    print(f"Strands Document Verifier Performance Benchmark")
+    print(f"{'='*60}{Style.RESET_ALL}")
+
+    timestamp = int(time.time())
 
-    if not uncached_result["success"]:
-        print(f"{Fore.RED}Uncached run failed: {uncached_result['error']}{Style.RESET_ALL}")
-        print(f"STDOUT: {uncached_result.get('stdout', '')}")
-        print(f"STDERR: {uncached_result.get('stderr', '')}")
-        return
+    mode = "in parallel" if parallel else "one after another"
+    print(f"\n{Fore.YELLOW}Running CACHING ENABLED and CACHING DISABLED phases {mode}{Style.RESET_ALL}")
+
+    # Unless --verbose is given, verification output streams to a log file that is
+    # only read back on failure, rather than accumulating in memory
+    log_path = Path(f"./results/benchmark-{timestamp}.log")
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with contextlib.ExitStack() as stack:
+        if not verbose:
+            log_file = stack.enter_context(open(log_path, "w", encoding="utf-8"))
+            stack.enter_context(contextlib.redirect_stdout(log_file))
+        cached_result, uncached_result = run_phases(parallel, str(timestamp), verbose)
+
+    for label, result in (("Cached", cached_result), ("Uncached", uncached_result)):
+        if result is not None and not result["success"]:
+            print(f"{Fore.RED}{label} run failed: {result['error']}{Style.RESET_ALL}")
+            if not verbose:
+                output = log_path.read_text(encoding="utf-8")
+                if output:
+                    print(f"OUTPUT ({log_path}):\n{output}")
+            return
 
     # Compare results
     print(f"\n{Fore.GREEN}{'='*60}")
@@ -130,6 +150,8 @@ def main():
     print(f"\n{Fore.BLUE}Result files saved for detailed analysis:{Style.RESET_ALL}")
     print(f"  Cached: ./results/{cached_result['session_id']}.json")
     print(f"  Uncached: ./results/{uncached_result['session_id']}.json")
+    if not verbose:
+        print(f"  Log: {log_path}")
 
     # Ask user if they want to view table results
     print(f"\n{Fore.YELLOW}View detailed results in table format?{Style.RESET_ALL}")
@@ -137,15 +159,11 @@ def main():
 
     if response in ['c', 'b']:
         print(f"\n{Fore.CYAN}=== CACHED RESULTS TABLE ==={Style.RESET_ALL}")
-        subprocess.run([
-            "python", "main.py", "view-table", cached_result['session_id']
-        ])
+        load_and_display_results(f"./results/{cached_result['session_id']}.json")
 
     if response in ['u', 'b']:
         print(f"\n{Fore.CYAN}=== UNCACHED RESULTS TABLE ==={Style.RESET_ALL}")
-        subprocess.run([
-            "python", "main.py", "view-table", uncached_result['session_id']
-        ])
+        load_and_display_results(f"./results/{uncached_result['session_id']}.json")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
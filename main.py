@@ -3,8 +3,6 @@ import click
 import os
 from pathlib import Path
 from src.config import Config
-from src.orchestrator import DocumentVerificationOrchestrator
-from src.telemetry import setup_telemetry
 from colorama import Fore, Style, init
 
 # Initialize colorama
@@ -20,8 +18,10 @@ init(autoreset=True)
 @click.option('--arize-space-id', help='Arize space ID for telemetry')
 @click.option('--arize-api-key', help='Arize API key for telemetry')
 @click.option('--no-cache', is_flag=True, help='Disable caching for performance comparison')
+@click.option('--result-cache', is_flag=True, help='Reuse agent results from earlier runs on the same inputs')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
-def verify(source_dir, target_dir, results_dir, session_id, aws_profile, aws_region, arize_space_id, arize_api_key, no_cache, verbose):
+@click.option('--quiet', '-q', is_flag=True, help='Plain progress lines without boxes, colors or progress bars (e.g. for CI logs)')
+def verify(source_dir, target_dir, results_dir, session_id, aws_profile, aws_region, arize_space_id, arize_api_key, no_cache, result_cache, verbose, quiet):
     """
     Verify target document against source documents using multi-agent analysis.
 
@@ -31,6 +31,11 @@ def verify(source_dir, target_dir, results_dir, session_id, aws_profile, aws_reg
     3. Make verification decisions
     4. Generate citation-backed results
     """
+    # Bedrock/Strands/OpenTelemetry are only needed here; keep other commands fast to start
+    from src.orchestrator import DocumentVerificationOrchestrator
+    from src.telemetry import setup_telemetry
+    from src.utils import list_txt_files
+
     try:
         # Create directories if they don't exist
         Path(results_dir).mkdir(parents=True, exist_ok=True)
@@ -45,7 +50,9 @@ def verify(source_dir, target_dir, results_dir, session_id, aws_profile, aws_reg
             aws_region=aws_region,
             arize_space_id=arize_space_id,
             arize_api_key=arize_api_key,
-            enable_caching=not no_cache  # Invert no_cache flag
+            enable_caching=not no_cache,  # Invert no_cache flag
+            enable_result_cache=result_cache,
+            verbose=not quiet
         )
 
         if verbose:
@@ -69,8 +76,8 @@ def verify(source_dir, target_dir, results_dir, session_id, aws_profile, aws_reg
         if not Path(target_dir).exists():
             raise click.ClickException(f"Target directory '{target_dir}' does not exist")
 
-        source_files = list(Path(source_dir).glob("*.txt"))
-        target_files = list(Path(target_dir).glob("*.txt"))
+        source_files = list_txt_files(source_dir)
+        target_files = list_txt_files(target_dir)
 
         if not source_files:
             raise click.ClickException(f"No TXT files found in source directory '{source_dir}'")
@@ -95,10 +102,14 @@ def verify(source_dir, target_dir, results_dir, session_id, aws_profile, aws_reg
                 span.set_attribute("session.id", session_id)
 
             orchestrator = DocumentVerificationOrchestrator(config)
-            result_path = orchestrator.verify_document(session_id)
+            result_path, _ = orchestrator.verify_document(session_id)
 
             span.set_attribute("result.path", result_path)
 
+        # The result file is written in the background; wait for it (and surface
+        # any write error) before reporting where it was saved
+        orchestrator.flush()
+
         click.echo(f"{Fore.GREEN}[COMPLETED]{Style.RESET_ALL} Verification finished successfully!")
         click.echo(f"{Fore.BLUE}[RESULT]{Style.RESET_ALL} Results saved to: {result_path}")
 
@@ -0,0 +1,54 @@
+import threading
+from functools import lru_cache
+from typing import Optional, Tuple, TYPE_CHECKING
+from src.config import Config
+
+if TYPE_CHECKING:
+    import boto3
+    from strands.models import BedrockModel
+
+# boto3 Sessions aren't thread-safe while creating clients, so the shared session and
+# the models built on it are only created under this lock
+_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def _get_boto_session(aws_region: str, aws_profile: Optional[str]) -> "boto3.Session":
+    import boto3
+
+    return boto3.Session(
+        region_name=aws_region,
+        profile_name=aws_profile
+    )
+
+@lru_cache(maxsize=None)
+def _get_bedrock_model(config_key: Tuple) -> "BedrockModel":
+    from strands.models import BedrockModel
+
+    (aws_region, aws_profile, model_id, max_tokens, temperature,
+     enable_caching, cache_prompt, cache_tools) = config_key
+
+    # Apply caching configuration if enabled
+    model_kwargs = {
+        "model_id": model_id,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "boto_session": _get_boto_session(aws_region, aws_profile),
+    }
+
+    if enable_caching:
+        if cache_prompt:
+            model_kwargs["cache_prompt"] = cache_prompt
+        if cache_tools:
+            model_kwargs["cache_tools"] = cache_tools
+
+    return BedrockModel(**model_kwargs)
+
+def get_boto_session(config: Config) -> "boto3.Session":
+    """Return the boto3 session shared by everything using this AWS region/profile"""
+    with _lock:
+        return _get_boto_session(config.aws_region, config.aws_profile)
+
+def get_bedrock_model(config: Config) -> "BedrockModel":
+    """Return the BedrockModel shared by all agents with the same model settings"""
+    with _lock:
+        return _get_bedrock_model(config.model_cache_key)
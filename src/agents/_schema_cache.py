@@ -0,0 +1,26 @@
+import copy
+from typing import Any, Dict
+from pydantic import BaseModel
+
+_SCHEMAS: Dict[tuple, Dict[str, Any]] = {}
+
+class CachedSchemaModel(BaseModel):
+    """
+    BaseModel whose JSON schema is generated once per class.
+
+    structured_output rebuilds the tool spec from model_json_schema() on every
+    call; caching the generated schema skips Pydantic's schema generation.
+    """
+    @classmethod
+    def model_json_schema(cls, *args, **kwargs) -> Dict[str, Any]:
+        try:
+            key = (cls, args, tuple(sorted(kwargs.items())))
+            schema = _SCHEMAS.get(key)
+        except TypeError:  # Unhashable arguments, generate without caching
+            return super().model_json_schema(*args, **kwargs)
+
+        if schema is None:
+            schema = _SCHEMAS[key] = super().model_json_schema(*args, **kwargs)
+
+        # Callers may rewrite the schema in place (Strands flattens it), so hand out copies
+        return copy.deepcopy(schema)
@@ -1,12 +1,15 @@
-import boto3
 from strands import Agent, tool
-from strands.models import BedrockModel
 from src.config import Config
-from src.utils import load_prompt, render_prompt
-import json
-from typing import Dict, Any, List, Optional
+from src.agents._model_cache import get_bedrock_model
+from src.agents._schema_cache import CachedSchemaModel
+from src.utils import load_prompt, compile_prompt, dumps_json
+from src.result_cache import ResultCache, content_key
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from strands.models import BedrockModel
+
 class Citation(BaseModel):
     docId: str = Field(description="Source document ID")
     version: int = Field(description="Document version number")
@@ -14,7 +17,7 @@ class Citation(BaseModel):
     span: str = Field(description="Section or span identifier")
     note: Optional[str] = Field(default=None, description="Additional context or explanation")
 
-class CitationBuildingResult(BaseModel):
+class CitationBuildingResult(CachedSchemaModel):
     """Complete citation building result."""
     citations: List[Citation] = Field(description="List of formatted citations")
 
@@ -23,28 +26,21 @@ class CitationBuilderAgent:
         self.config = config
         self.model = self._create_model()
         self.prompts = load_prompt("citation_builder")
-
-    def _create_model(self) -> BedrockModel:
-        session = boto3.Session(
-            region_name=self.config.aws_region,
-            profile_name=self.config.aws_profile
+        self._user_template = compile_prompt(self.prompts["user_prompt"])
+        self._results = ResultCache()
+        # structured_output doesn't append to the conversation, so one Agent serves every call
+        self._agent = Agent(
+            model=self.model,
+            system_prompt=self.prompts["system_prompt"],
+            trace_attributes={
+                "agent.type": "citation_builder"
+            },
+            name="CitationBuilder",
+            callback_handler=None  # Runs on claim worker threads; don't stream to stdout
         )
 
-        # Apply caching configuration if enabled
-        model_kwargs = {
-            "model_id": self.config.model_id,
-            "max_tokens": self.config.max_tokens,
-            "temperature": self.config.temperature,
-            "boto_session": session,
-        }
-
-        if self.config.enable_caching:
-            if self.config.cache_prompt:
-                model_kwargs["cache_prompt"] = self.config.cache_prompt
-            if self.config.cache_tools:
-                model_kwargs["cache_tools"] = self.config.cache_tools
-
-        return BedrockModel(**model_kwargs)
+    def _create_model(self) -> "BedrockModel":
+        return get_bedrock_model(self.config)
 
     @tool
     def build_citations(self, evidence_data: str, source_metadata: str) -> str:
@@ -58,18 +54,14 @@ class CitationBuilderAgent:
         Returns:
             JSON string containing formatted citations
         """
-        try:
-            agent = Agent(
-                model=self.model,
-                system_prompt=self.prompts["system_prompt"],
-                trace_attributes={
-                    "agent.type": "citation_builder"
-                },
-                name="CitationBuilder"
-            )
+        # Identical evidence (e.g. shared by several claims) yields identical citations
+        cache_key = content_key(evidence_data, source_metadata)
+        cached = self._results.get(cache_key)
+        if cached is not None:
+            return cached
 
-            user_prompt = render_prompt(
-                self.prompts["user_prompt"],
+        try:
+            user_prompt = self._user_template.render(
                 {
                     "evidence_data": evidence_data,
                     "source_metadata": source_metadata
@@ -77,12 +69,14 @@ class CitationBuilderAgent:
             )
 
             # Use structured_output for guaranteed JSON format
-            result = agent.structured_output(CitationBuildingResult, user_prompt)
+            result = self._agent.structured_output(CitationBuildingResult, user_prompt)
 
-            return json.dumps(result.model_dump(), ensure_ascii=False)
+            result_json = result.model_dump_json(warnings=False)
+            self._results.put(cache_key, result_json)
+            return result_json
 
         except Exception as e:
-            return json.dumps({"error": f"Citation building failed: {str(e)}"})
+            return dumps_json({"error": f"Citation building failed: {str(e)}"})
 
 def create_citation_builder_tool(config: Config):
     """Factory function to create citation builder tool"""
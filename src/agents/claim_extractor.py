@@ -1,12 +1,15 @@
-import boto3
 from strands import Agent, tool
-from strands.models import BedrockModel
+from opentelemetry import trace
 from src.config import Config
-from src.utils import load_prompt, render_prompt
-import json
-from typing import Dict, Any, List
+from src.agents._model_cache import get_bedrock_model
+from src.agents._schema_cache import CachedSchemaModel
+from src.utils import load_prompt, compile_prompt, dumps_json
+from typing import Dict, Any, List, TYPE_CHECKING
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from strands.models import BedrockModel
+
 class TargetLocator(BaseModel):
     page: int = Field(description="Line number or page reference")
     span: str = Field(description="Section or span identifier")
@@ -17,37 +20,30 @@ class ExtractedClaim(BaseModel):
     target_locator: TargetLocator = Field(description="Location information")
     category: str = Field(description="Category or section of the claim")
 
-class ClaimsExtractionResult(BaseModel):
+class ClaimsExtractionResult(CachedSchemaModel):
     """Complete claims extraction result."""
     claims: List[ExtractedClaim] = Field(description="List of extracted claims")
 
+_tracer = trace.get_tracer("strands-verifier")
+
 class ClaimExtractorAgent:
     def __init__(self, config: Config):
         self.config = config
         self.model = self._create_model()
         self.prompts = load_prompt("claim_extractor")
-
-    def _create_model(self) -> BedrockModel:
-        session = boto3.Session(
-            region_name=self.config.aws_region,
-            profile_name=self.config.aws_profile
+        self._user_template = compile_prompt(self.prompts["user_prompt"])
+        # structured_output doesn't append to the conversation, so one Agent serves every call
+        self._agent = Agent(
+            model=self.model,
+            system_prompt=self.prompts["system_prompt"],
+            trace_attributes={
+                "agent.type": "claim_extractor"
+            },
+            name="ClaimExtractor"
         )
 
-        # Apply caching configuration if enabled
-        model_kwargs = {
-            "model_id": self.config.model_id,
-            "max_tokens": self.config.max_tokens,
-            "temperature": self.config.temperature,
-            "boto_session": session,
-        }
-
-        if self.config.enable_caching:
-            if self.config.cache_prompt:
-                model_kwargs["cache_prompt"] = self.config.cache_prompt
-            if self.config.cache_tools:
-                model_kwargs["cache_tools"] = self.config.cache_tools
-
-        return BedrockModel(**model_kwargs)
+    def _create_model(self) -> "BedrockModel":
+        return get_bedrock_model(self.config)
 
     @tool
     def extract_claims(self, document_name: str, document_content: str) -> str:
@@ -62,18 +58,7 @@ class ClaimExtractorAgent:
             JSON string containing extracted claims
         """
         try:
-            agent = Agent(
-                model=self.model,
-                system_prompt=self.prompts["system_prompt"],
-                trace_attributes={
-                    "agent.type": "claim_extractor",
-                    "document.name": document_name
-                },
-                name="ClaimExtractor"
-            )
-
-            user_prompt = render_prompt(
-                self.prompts["user_prompt"],
+            user_prompt = self._user_template.render(
                 {
                     "document_name": document_name,
                     "document_content": document_content
@@ -81,12 +66,16 @@ class ClaimExtractorAgent:
             )
 
             # Use structured_output for guaranteed JSON format
-            result = agent.structured_output(ClaimsExtractionResult, user_prompt)
+            with _tracer.start_as_current_span(
+                "claim_extractor.extract_claims",
+                attributes={"document.name": document_name}
+            ):
+                result = self._agent.structured_output(ClaimsExtractionResult, user_prompt)
 
-            return json.dumps(result.model_dump(), ensure_ascii=False)
+            return result.model_dump_json(warnings=False)
 
         except Exception as e:
-            return json.dumps({"error": f"Claim extraction failed: {str(e)}"})
+            return dumps_json({"error": f"Claim extraction failed: {str(e)}"})
 
 def create_claim_extractor_tool(config: Config):
     """Factory function to create claim extractor tool"""
@@ -1,13 +1,24 @@
-import boto3
 from strands import Agent, tool
-from strands.models import BedrockModel
 from src.config import Config
-from src.utils import load_prompt, render_prompt
+from src.agents._model_cache import get_bedrock_model
+from src.agents._schema_cache import CachedSchemaModel
+from src.utils import load_prompt, compile_prompt, dumps_json
+from src.result_cache import ResultCache, content_key
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
+from pydantic import Field
 import json
-from typing import Dict, Any, List
-from pydantic import BaseModel, Field
+import re
 
-class DecisionJudgmentResult(BaseModel):
+if TYPE_CHECKING:
+    from strands.models import BedrockModel
+
+_JSON_START = re.compile(r'\{')
+_JSON_DECODER = json.JSONDecoder()
+
+# Fallback response when the judgment can't be parsed; only the rationale varies
+_NOT_FOUND_TEMPLATE = '{{"fallback":true,"verdict":"NOT_FOUND","confidence":0,"rationale":{},"supporting_evidence":[],"contradicting_evidence":[]}}'
+
+class DecisionJudgmentResult(CachedSchemaModel):
     """Complete decision judgment result."""
     verdict: str = Field(description="Must be one of: SUPPORTED, CONTRADICTED, PARTIAL, NOT_FOUND")
     confidence: int = Field(description="Confidence score from 0-100", ge=0, le=100)
@@ -15,33 +26,40 @@ class DecisionJudgmentResult(BaseModel):
     supporting_evidence: List[str] = Field(default_factory=list, description="IDs of supporting evidence")
     contradicting_evidence: List[str] = Field(default_factory=list, description="IDs of contradicting evidence")
 
+def _extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """Return the first complete JSON object embedded in text, if any"""
+    for match in _JSON_START.finditer(text):
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, match.start())
+        except ValueError:
+            continue
+        if isinstance(obj, dict):
+            return obj
+    return None
+
 class DecisionJudgeAgent:
     def __init__(self, config: Config):
         self.config = config
         self.model = self._create_model()
         self.prompts = load_prompt("decision_judge")
+        self._user_template = compile_prompt(self.prompts["user_prompt"])
+        self._results = ResultCache()
+        # structured_output doesn't append to the conversation, so one Agent serves every call
+        self._agent = self._build_agent()
 
-    def _create_model(self) -> BedrockModel:
-        session = boto3.Session(
-            region_name=self.config.aws_region,
-            profile_name=self.config.aws_profile
-        )
-
-        # Apply caching configuration if enabled
-        model_kwargs = {
-            "model_id": self.config.model_id,
-            "max_tokens": self.config.max_tokens,
-            "temperature": self.config.temperature,
-            "boto_session": session,
-        }
+    def _create_model(self) -> "BedrockModel":
+        return get_bedrock_model(self.config)
 
-        if self.config.enable_caching:
-            if self.config.cache_prompt:
-                model_kwargs["cache_prompt"] = self.config.cache_prompt
-            if self.config.cache_tools:
-                model_kwargs["cache_tools"] = self.config.cache_tools
-
-        return BedrockModel(**model_kwargs)
+    def _build_agent(self) -> Agent:
+        return Agent(
+            model=self.model,
+            system_prompt=self.prompts["system_prompt"],
+            name="DecisionJudge",
+            trace_attributes={
+                "agent.type": "decision_judge"
+            },
+            callback_handler=None  # Runs on claim worker threads; don't stream to stdout
+        )
 
     @tool
     def judge_claim(self, claim_text: str, evidence_data: str) -> str:
@@ -55,18 +73,13 @@ class DecisionJudgeAgent:
         Returns:
             JSON string containing verdict, confidence, and rationale
         """
-        try:
-            agent = Agent(
-                model=self.model,
-                system_prompt=self.prompts["system_prompt"],
-                name="DecisionJudge",
-                trace_attributes={
-                    "agent.type": "decision_judge"
-                }
-            )
+        cache_key = content_key(claim_text, evidence_data)
+        cached = self._results.get(cache_key)
+        if cached is not None:
+            return cached
 
-            user_prompt = render_prompt(
-                self.prompts["user_prompt"],
+        try:
+            user_prompt = self._user_template.render(
                 {
                     "claim_text": claim_text,
                     "evidence_data": evidence_data
@@ -75,40 +88,30 @@ class DecisionJudgeAgent:
 
             # Try structured_output first, fallback to regular text parsing
             try:
-                result = agent.structured_output(DecisionJudgmentResult, user_prompt)
-                return json.dumps(result.model_dump(), ensure_ascii=False)
+                result = self._agent.structured_output(DecisionJudgmentResult, user_prompt)
+                result_json = result.model_dump_json(warnings=False)
+                self._results.put(cache_key, result_json)
+                return result_json
             except Exception as e:
-                # Fallback to text-based response parsing
-                response = agent(user_prompt + "\n\nProvide your response in JSON format with verdict, confidence, and rationale fields.")
+                # Fallback to text-based response parsing on a throwaway Agent,
+                # since a regular invocation records the exchange in its history
+                response = self._build_agent()(user_prompt + "\n\nProvide your response in JSON format with verdict, confidence, and rationale fields.")
                 response_text = str(response)
 
                 # Try to extract structured information from text response
                 try:
                     # Look for JSON in the response
-                    import re
-                    json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-                    if json_match:
-                        return json_match.group(0)
+                    json_object = _extract_json_object(response_text)
+                    if json_object is not None:
+                        return dumps_json({"fallback": True, **json_object})
                     else:
                         # Create minimal valid response
-                        return json.dumps({
-                            "verdict": "NOT_FOUND",
-                            "confidence": 0,
-                            "rationale": f"Failed to parse structured output: {response_text[:200]}",
-                            "supporting_evidence": [],
-                            "contradicting_evidence": []
-                        })
+                        return _NOT_FOUND_TEMPLATE.format(dumps_json(f"Failed to parse structured output: {response_text[:200]}"))
                 except:
-                    return json.dumps({
-                        "verdict": "NOT_FOUND",
-                        "confidence": 0,
-                        "rationale": f"Complete parsing failure: {str(e)}",
-                        "supporting_evidence": [],
-                        "contradicting_evidence": []
-                    })
+                    return _NOT_FOUND_TEMPLATE.format(dumps_json(f"Complete parsing failure: {str(e)}"))
 
         except Exception as e:
-            return json.dumps({"error": f"Decision judgment failed: {str(e)}"})
+            return dumps_json({"error": f"Decision judgment failed: {str(e)}"})
 
 def create_decision_judge_tool(config: Config):
     """Factory function to create decision judge tool"""
@@ -1,11 +1,18 @@
-import boto3
 from strands import Agent, tool
-from strands.models import BedrockModel
+from opentelemetry import trace
 from src.config import Config
-from src.utils import load_prompt, render_prompt
-import json
-from typing import Dict, Any, List
+from src.agents._model_cache import get_bedrock_model
+from src.agents._schema_cache import CachedSchemaModel
+from src.utils import load_prompt, compile_prompt, dumps_json, loads_json
+from src.result_cache import ResultCache, content_key
+from src.retrieval.prefilter import SourcePrefilter
+from collections import OrderedDict
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
 from pydantic import BaseModel, Field
+import threading
+
+if TYPE_CHECKING:
+    from strands.models import BedrockModel
 
 class EvidenceLocation(BaseModel):
     page: int = Field(description="Page or line number")
@@ -18,104 +25,206 @@ class Evidence(BaseModel):
     relevance_score: float = Field(description="Relevance score between 0-1")
     relationship: str = Field(description="supports|contradicts|relates")
 
-class EvidenceRetrievalResult(BaseModel):
+class EvidenceRetrievalResult(CachedSchemaModel):
     """Complete evidence retrieval result."""
     evidence: List[Evidence] = Field(description="List of found evidence")
 
+class ClaimEvidenceBatch(BaseModel):
+    claim_id: str = Field(description="Identifier of the claim this evidence belongs to")
+    evidence: List[Evidence] = Field(description="List of found evidence for the claim")
+
+class EvidenceRetrievalBatchResult(CachedSchemaModel):
+    """Evidence retrieval result for a batch of claims."""
+    results: List[ClaimEvidenceBatch] = Field(description="Evidence grouped by claim, one entry per claim")
+
+_tracer = trace.get_tracer("strands-verifier")
+
+# Most recent source corpora kept per retriever; older ids stop resolving
+_MAX_SOURCES = 4
+
+class _Source(NamedTuple):
+    """A registered source corpus and what searches over it use"""
+    documents: str
+    prefilter: Optional[SourcePrefilter]
+    agent_cached: Optional[Agent]
+
 class EvidenceRetrieverAgent:
     def __init__(self, config: Config):
         self.config = config
         self.model = self._create_model()
         self.prompts = load_prompt("evidence_retriever")
-
-    def _create_model(self) -> BedrockModel:
-        session = boto3.Session(
-            region_name=self.config.aws_region,
-            profile_name=self.config.aws_profile
-        )
-
-        # Apply caching configuration if enabled
-        model_kwargs = {
-            "model_id": self.config.model_id,
-            "max_tokens": self.config.max_tokens,
-            "temperature": self.config.temperature,
-            "boto_session": session,
+        self._templates = {
+            name: compile_prompt(self.prompts[name])
+            for name in ("user_prompt", "batch_user_prompt")
         }
+        # structured_output doesn't append to the conversation, so long-lived Agents
+        # serve every call; the claim being searched is recorded on a wrapping span
+        self._agent = Agent(
+            model=self.model,
+            system_prompt=self.prompts["system_prompt"],
+            trace_attributes={
+                "agent.type": "evidence_retriever"
+            },
+            name="EvidenceRetriever",
+            callback_handler=None  # Runs on claim worker threads; don't stream to stdout
+        )
+        # Source corpora by id, so tool calls (including ones made by an LLM) pass a short
+        # reference instead of the full document text. Searches resolve an id once into
+        # locals, so registering a new corpus never changes a search already running.
+        self._sources: "OrderedDict[str, _Source]" = OrderedDict()
+        self._sources_lock = threading.Lock()
+        self._results = ResultCache()
+        self.set_source_documents("")
+
+    def _create_model(self) -> "BedrockModel":
+        return get_bedrock_model(self.config)
+
+    def set_source_documents(self, source_documents: str, prefilter: Optional[SourcePrefilter] = None) -> str:
+        """
+        Register source documents; calls without a source_doc_id search the latest ones.
+
+        With caching and cache_prompt enabled, large corpora go into the system
+        prompt of a dedicated Agent. That prompt is still sent with every request, but
+        BedrockModel's cache_prompt marks it with a cache point, so Bedrock
+        reads it from the prompt cache instead of processing it again. With a
+        prefilter, searches send only the chunks relevant to each claim.
+        Returns the source_doc_id the tools accept in place of the text.
+        """
+        # The digest doubles as the source_doc_id and as part of result cache keys
+        source_digest = content_key(source_documents)
+
+        # Prefiltered excerpts differ per claim, so there is no shared corpus worth caching, and
+        # without cache_prompt the model sets no cache point after the system prompt
+        agent_cached = None
+        if (self.config.enable_caching and self.config.cache_prompt and prefilter is None
+                and len(source_documents) > 1000):  # Only cache large documents
+            agent_cached = Agent(
+                model=self.model,
+                system_prompt=f"{self.prompts['system_prompt']}\nSource Documents:\n{source_documents}",
+                trace_attributes={
+                    "agent.type": "evidence_retriever",
+                    "caching.enabled": True
+                },
+                name="EvidenceRetriever",
+                callback_handler=None  # Runs on claim worker threads; don't stream to stdout
+            )
 
-        if self.config.enable_caching:
-            if self.config.cache_prompt:
-                model_kwargs["cache_prompt"] = self.config.cache_prompt
-            if self.config.cache_tools:
-                model_kwargs["cache_tools"] = self.config.cache_tools
-
-        return BedrockModel(**model_kwargs)
+        with self._sources_lock:
+            self._sources[source_digest] = _Source(source_documents, prefilter, agent_cached)
+            self._sources.move_to_end(source_digest)
+            while len(self._sources) > _MAX_SOURCES:
+                self._sources.popitem(last=False)
+            # Default corpus for calls that don't pass a source_doc_id
+            self._source_digest = source_digest
+
+        return source_digest
+
+    def _resolve_source(self, source_doc_id: str) -> Tuple[str, _Source]:
+        """Look up a registered corpus by id, defaulting to the most recently set one"""
+        with self._sources_lock:
+            source_doc_id = source_doc_id or self._source_digest
+            source = self._sources.get(source_doc_id)
+        if source is None:
+            raise ValueError(f"Unknown source_doc_id '{source_doc_id}'; call set_source_documents first")
+        return source_doc_id, source
+
+    def _structured_search(self, output_model, source_doc_id: str, queries: List[str], request: List[str], prompt_name: str, variables: Dict[str, Any]) -> str:
+        """Run a structured evidence search, returning its JSON and reusing results for repeated inputs"""
+        source_doc_id, source = self._resolve_source(source_doc_id)
+        source_documents = source.documents
+
+        cache_key = content_key(prompt_name, *request, source_doc_id)
+        cached = self._results.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if source.prefilter is not None:
+            source_documents = source.prefilter.excerpt(queries, self.config.prefilter_top_n)
+
+        result = self._run_search(output_model, source_documents, source.agent_cached, request, prompt_name, variables)
+        result_json = result.model_dump_json(warnings=False)
+        self._results.put(cache_key, result_json)
+        return result_json
+
+    def _run_search(self, output_model, source_documents: str, agent_cached: Optional[Agent], request: List[str], prompt_name: str, variables: Dict[str, Any]):
+        """Run a structured evidence search, caching the source documents when enabled"""
+        variables["source_documents"] = source_documents
+
+        if agent_cached is not None:
+            # The corpus is already in the cached system prompt; send only the request
+            prompt = [{"text": text} for text in request]
+            return agent_cached.structured_output(output_model, prompt)
+
+        # Standard processing without message caching
+        user_prompt = self._templates[prompt_name].render(variables)
+        return self._agent.structured_output(output_model, user_prompt)
 
     @tool
-    def retrieve_evidence(self, claim_text: str, source_documents: str) -> str:
+    def retrieve_evidence(self, claim_text: str, source_doc_id: str = "") -> str:
         """
         Search for evidence supporting or contradicting a claim in source documents.
 
         Args:
             claim_text: The claim to find evidence for
-            source_documents: Text content of all source documents
+            source_doc_id: ID returned by set_source_documents (defaults to the current source documents)
 
         Returns:
             JSON string containing found evidence
         """
         try:
-            agent = Agent(
-                model=self.model,
-                system_prompt=self.prompts["system_prompt"],
-                trace_attributes={
-                    "agent.type": "evidence_retriever",
-                    "claim.text": claim_text[:100]  # First 100 chars for tracing
-                },
-                name="EvidenceRetriever"
-            )
-
-            user_prompt = render_prompt(
-                self.prompts["user_prompt"],
-                {
-                    "claim_text": claim_text,
-                    "source_documents": source_documents
-                }
-            )
-
-            # Use messages with caching for source documents if caching is enabled
-            if self.config.enable_caching and len(source_documents) > 1000:  # Only cache large documents
-                messages = [
-                    {
-                        "role": "user",
-                        "content": [
-                            {"text": f"Source Documents:\n{source_documents}"},
-                            {"cachePoint": {"type": "default"}},  # Cache the source documents
-                            {"text": f"\nClaim to find evidence for: {claim_text}"}
-                        ]
-                    }
-                ]
-                agent_with_messages = Agent(
-                    model=self.model,
-                    system_prompt=self.prompts["system_prompt"],
-                    messages=messages,
-                    trace_attributes={
-                        "agent.type": "evidence_retriever",
-                        "claim.text": claim_text[:100],
-                        "caching.enabled": True
-                    },
-                    name="EvidenceRetriever"
-                )
-                result = agent_with_messages.structured_output(
+            with _tracer.start_as_current_span(
+                "evidence_retriever.retrieve_evidence",
+                attributes={"claim.text": claim_text[:100]}  # First 100 chars for tracing
+            ):
+                return self._structured_search(
                     EvidenceRetrievalResult,
-                    "Find evidence for the claim using the provided source documents."
+                    source_doc_id,
+                    [claim_text],
+                    [
+                        f"\nClaim to find evidence for: {claim_text}",
+                        "Find evidence for the claim using the provided source documents."
+                    ],
+                    "user_prompt",
+                    {"claim_text": claim_text}
                 )
-            else:
-                # Standard processing without message caching
-                result = agent.structured_output(EvidenceRetrievalResult, user_prompt)
 
-            return json.dumps(result.model_dump(), ensure_ascii=False)
+        except Exception as e:
+            return dumps_json({"error": f"Evidence retrieval failed: {str(e)}"})
+
+    @tool
+    def retrieve_evidence_batch(self, claims_json: str, source_doc_id: str = "") -> str:
+        """
+        Search for evidence for several claims in a single pass over the source documents.
+
+        Args:
+            claims_json: JSON list of objects with claim_id and claim_text
+            source_doc_id: ID returned by set_source_documents (defaults to the current source documents)
+
+        Returns:
+            JSON string containing found evidence grouped by claim_id
+        """
+        try:
+            claims = loads_json(claims_json)
+            claims_list = "\n".join(f"- [{claim['claim_id']}] {claim['claim_text']}" for claim in claims)
+
+            with _tracer.start_as_current_span(
+                "evidence_retriever.retrieve_evidence_batch",
+                attributes={"claim.count": len(claims)}
+            ):
+                return self._structured_search(
+                    EvidenceRetrievalBatchResult,
+                    source_doc_id,
+                    [claim['claim_text'] for claim in claims],
+                    [
+                        f"\nClaims to find evidence for:\n{claims_list}",
+                        "Find evidence for each claim using the provided source documents. Return one result per claim_id."
+                    ],
+                    "batch_user_prompt",
+                    {"claims": claims_list}
+                )
 
         except Exception as e:
-            return json.dumps({"error": f"Evidence retrieval failed: {str(e)}"})
+            return dumps_json({"error": f"Batch evidence retrieval failed: {str(e)}"})
 
 def create_evidence_retriever_tool(config: Config):
     """Factory function to create evidence retriever tool"""
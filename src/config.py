@@ -16,6 +16,24 @@ class Config(BaseModel):
     cache_prompt: Optional[str] = "default"
     cache_tools: Optional[str] = "default"
 
+    # Claims sent per evidence retrieval call (0 sends every claim in one call, 1 disables batching)
+    evidence_batch_size: int = 8
+
+    # Claims verified concurrently (bounded by the Bedrock request quota)
+    max_parallel_claims: int = 8
+
+    # BM25 prefilter: evidence searches see only the top-N source chunks per claim
+    # instead of the full corpus (disabled keeps the full-document path)
+    enable_prefilter: bool = False
+    prefilter_top_n: int = 20
+
+    # Reuse tool results across runs from an on-disk cache keyed by input content
+    enable_result_cache: bool = False
+    result_cache_dir: str = "~/.cache/strands-verifier"
+
+    # Console UI: boxes, progress bars and per-claim details (only shown on a terminal without NO_COLOR)
+    verbose: bool = True
+
     # Paths
     source_dir: str = "./source"
     target_dir: str = "./target"
@@ -27,6 +45,20 @@ class Config(BaseModel):
     arize_api_key: Optional[str] = None
     arize_project_name: str = "strands-verifier"
 
+    @property
+    def model_cache_key(self) -> tuple:
+        """Hashable key of the settings that determine the Bedrock model"""
+        return (
+            self.aws_region,
+            self.aws_profile,
+            self.model_id,
+            self.max_tokens,
+            self.temperature,
+            self.enable_caching,
+            self.cache_prompt,
+            self.cache_tools,
+        )
+
     @classmethod
     def from_env(cls) -> "Config":
         return cls(
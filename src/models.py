@@ -1,6 +1,9 @@
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import List, Optional
+
+# Shape of the saved verification report. The orchestrator builds these with
+# model_construct from already-validated agent output and writes them with
+# model_dump_json, so no dict is assembled or re-validated along the way.
 
 class TargetLocator(BaseModel):
     page: int
@@ -56,6 +59,12 @@ class Audit(BaseModel):
     reviewStage: str
     notes: str
 
+class Performance(BaseModel):
+    total_time_seconds: float
+    claims_processed: int
+    avg_time_per_claim: float
+    caching_enabled: bool
+
 class VerificationResult(BaseModel):
     document_id: str
     title: str
@@ -65,4 +74,5 @@ class VerificationResult(BaseModel):
     dependencies: List[str]
     status: str
     blocks: List[Block]
-    audit: Audit
\ No newline at end of file
+    audit: Audit
+    performance: Optional[Performance] = None
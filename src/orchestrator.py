@@ -1,58 +1,151 @@
-import boto3
-from strands import Agent
-from strands.models import BedrockModel
 from src.config import Config
-from src.utils import load_prompt, render_prompt, load_txt_file, save_json_result
-from src.agents.claim_extractor import create_claim_extractor_tool
-from src.agents.evidence_retriever import create_evidence_retriever_tool
-from src.agents.decision_judge import create_decision_judge_tool
-from src.agents.citation_builder import create_citation_builder_tool
-from src.models import VerificationResult
-from pathlib import Path
-import json
+from src.agents._model_cache import get_boto_session
+from src.utils import load_prompt, compile_prompt, list_txt_files, load_txt_file, save_json_result, save_model_result, dumps_json, loads_json
+from src.retrieval.prefilter import SourcePrefilter
+from src.result_cache import DiskResultCache, content_key, is_cacheable
+from src.models import (
+    VerificationResult, Details, SourceDocument, Audit, Performance,
+    Block, BlockDetails, Claim, ClaimDetails, TargetLocator, Citation
+)
+import os
 import uuid
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional, TYPE_CHECKING
+from functools import lru_cache
 from colorama import Fore, Style, init
 import time
 import shutil
-
-# Initialize colorama
-init(autoreset=True)
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+if TYPE_CHECKING:
+    from strands.models import BedrockModel
+
+_VERDICT_COLOR = {
+    "SUPPORTED": Fore.GREEN,
+    "CONTRADICTED": Fore.RED,
+    "PARTIAL": Fore.YELLOW,
+    "NOT_FOUND": Fore.BLUE
+}
+
+# Colored line templates for step output, built once instead of per call
+_STEP_RESULT_TEMPLATES = {
+    status: f"  {color}[{status}] {{}}: {{}}{Style.RESET_ALL}"
+    for status, color in {
+        "SUCCESS": Fore.GREEN,
+        "ERROR": Fore.RED,
+        "WARNING": Fore.YELLOW,
+        "PROCESSING": Fore.BLUE
+    }.items()
+}
+_LOG_STEP_PREFIXES = {
+    status: f"{color}[{status}]{Style.RESET_ALL}"
+    for status, color in {
+        "INFO": Fore.CYAN,
+        "SUCCESS": Fore.GREEN,
+        "WARNING": Fore.YELLOW,
+        "ERROR": Fore.RED,
+        "PROCESSING": Fore.BLUE
+    }.items()
+}
+
+# Prompts of the tools whose results go through the on-disk cache
+_TOOL_PROMPTS = ("claim_extractor", "evidence_retriever", "decision_judge", "citation_builder")
+
+@lru_cache(maxsize=None)
+def _init_colorama() -> None:
+    """Initialize colorama once, when the first orchestrator is created rather than at import"""
+    init(autoreset=True)
 
 class DocumentVerificationOrchestrator:
     def __init__(self, config: Config):
+        # Strands, boto3 and the agent modules are imported here so importing this
+        # module (e.g. for --help or config-only paths) stays cheap
+        from src.agents.claim_extractor import create_claim_extractor_tool
+        from src.agents.evidence_retriever import EvidenceRetrieverAgent
+        from src.agents.decision_judge import create_decision_judge_tool
+        from src.agents.citation_builder import create_citation_builder_tool
+
         self.config = config
         self.model = self._create_model()
         self.prompts = load_prompt("orchestrator")
+        # Templates are parsed once here and only filled in per run
+        self._compiled_prompts = {name: compile_prompt(template) for name, template in self.prompts.items()}
 
         # Create specialized agent tools
         self.claim_extractor = create_claim_extractor_tool(config)
-        self.evidence_retriever = create_evidence_retriever_tool(config)
+        self.evidence_retriever_agent = EvidenceRetrieverAgent(config)
+        self.evidence_retriever = self.evidence_retriever_agent.retrieve_evidence
+        self.evidence_retriever_batch = self.evidence_retriever_agent.retrieve_evidence_batch
         self.decision_judge = create_decision_judge_tool(config)
         self.citation_builder = create_citation_builder_tool(config)
+        self._disk_cache = DiskResultCache(config.result_cache_dir) if config.enable_result_cache else None
+        # Settings and prompts besides the tool inputs that change what a tool returns
+        self._cache_namespace = content_key(
+            repr(config.model_cache_key),
+            f"{config.enable_prefilter}|{config.prefilter_top_n}",
+            *(dumps_json(dict(load_prompt(name))) for name in _TOOL_PROMPTS)
+        )
 
-    def _create_model(self) -> BedrockModel:
-        session = boto3.Session(
-            region_name=self.config.aws_region,
-            profile_name=self.config.aws_profile
+        # Canonical source text from the last run, reused while the documents are unchanged
+        self._source_documents: Dict[str, str] = {}
+        self._source_docs_text = ""
+
+        # Result files are written in the background so verify_document can return sooner.
+        # Executor threads are joined at interpreter exit, so pending writes always complete.
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="result-writer")
+        self._pending_saves: List[Future] = []
+
+        # UI strings reused for every box and claim header
+        self._width = min(80, self._get_terminal_width() - 4)
+        self._hline = "─" * self._width
+        self._double_hline = "═" * self._width
+        self._pad_cache: Dict[int, str] = {}
+        self._claim_header_template = (
+            f"\n{Fore.MAGENTA}╔{self._double_hline}╗{Style.RESET_ALL}\n"
+            f"{Fore.MAGENTA}║{Style.RESET_ALL} {Fore.YELLOW}{{heading}}{Style.RESET_ALL}{{heading_pad}} {Fore.MAGENTA}║{Style.RESET_ALL}\n"
+            f"{Fore.MAGENTA}║{Style.RESET_ALL} {{text}}{{text_pad}} {Fore.MAGENTA}║{Style.RESET_ALL}\n"
+            f"{Fore.MAGENTA}╚{self._double_hline}╝{Style.RESET_ALL}\n"
         )
 
+        # Fancy UI only for verbose runs on a terminal that accepts color
+        self._interactive = config.verbose and sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+        if self._interactive:
+            _init_colorama()
+        else:
+            # Drop the progress bar and decorations; everything else prints as plain, uncolored lines
+            self._print_progress_bar = self._print_claim_header = lambda *args, **kwargs: None
+            self._print_box = self._print_plain_box
+            self._print_step_result = self._print_plain_step_result
+            self._print_section = self._print_plain_section
+            self._log_step = self._log_plain_step
+
+    def _create_model(self) -> "BedrockModel":
+        from strands.models import BedrockModel
+
         return BedrockModel(
             model_id=self.config.model_id,
             max_tokens=self.config.max_tokens,
             temperature=self.config.temperature,
-            boto_session=session,
+            boto_session=get_boto_session(self.config),
         )
 
     def _get_terminal_width(self):
         """Get terminal width for proper formatting"""
         return shutil.get_terminal_size().columns
 
+    def _pad(self, length: int) -> str:
+        """Return a (memoized) run of spaces used to right-align box borders"""
+        padding = self._pad_cache.get(length)
+        if padding is None:
+            padding = self._pad_cache[length] = " " * length
+        return padding
+
     def _print_box(self, title: str, content: list = None, color: str = Fore.CYAN, width: int = None):
         """Print a fancy box with title and content"""
         if width is None:
-            width = min(80, self._get_terminal_width() - 4)
+            width = self._width
 
         # Box characters
         top_left, top_right = "┌", "┐"
@@ -71,10 +164,18 @@ class DocumentVerificationOrchestrator:
         if content:
             for line in content:
                 line_padding = width - len(line) - 2
-                print(f"{color}{vertical}{Style.RESET_ALL} {line}{' ' * line_padding} {color}{vertical}{Style.RESET_ALL}")
+                print(f"{color}{vertical}{Style.RESET_ALL} {line}{self._pad(line_padding)} {color}{vertical}{Style.RESET_ALL}")
 
         # Bottom line
-        print(f"{color}{bottom_left}{horizontal * width}{bottom_right}{Style.RESET_ALL}")
+        hline = self._hline if width == self._width else horizontal * width
+        print(f"{color}{bottom_left}{hline}{bottom_right}{Style.RESET_ALL}")
+
+    def _print_plain_box(self, title: str, content: list = None, color: str = None, width: int = None):
+        """Print a box's title and content as plain, uncolored lines"""
+        lines = [f"[{title}]"]
+        if content:
+            lines.extend(f"  {line}" for line in content if line)
+        print("\n".join(lines))
 
     def _print_progress_bar(self, current: int, total: int, title: str = "", width: int = 40):
         """Print a progress bar"""
@@ -88,62 +189,161 @@ class DocumentVerificationOrchestrator:
         print(f"{Fore.CYAN}│{Style.RESET_ALL} {title}")
         print(f"{Fore.CYAN}│{Style.RESET_ALL} [{Fore.GREEN}{bar}{Style.RESET_ALL}] {current}/{total} ({percentage*100:.1f}%)")
 
-    def _print_claim_header(self, claim_id: str, claim_text: str, current: int, total: int):
+    def _print_claim_header(self, claim_id: str, claim_text: str, index: int, completed: int, total: int):
         """Print a fancy header for each claim"""
-        width = min(80, self._get_terminal_width() - 4)
+        width = self._width
 
         # Truncate claim text if too long
         max_text_length = width - 20
         display_text = claim_text[:max_text_length] + "..." if len(claim_text) > max_text_length else claim_text
+        # Claims finish out of order, so the document position and the completion count are shown apart
+        heading = f"CLAIM #{index} ({completed}/{total} done): {claim_id}"
 
-        print(f"\n{Fore.MAGENTA}╔{'═' * width}╗{Style.RESET_ALL}")
-        print(f"{Fore.MAGENTA}║{Style.RESET_ALL} {Fore.YELLOW}CLAIM {current}/{total}: {claim_id}{Style.RESET_ALL}{' ' * (width - len(f'CLAIM {current}/{total}: {claim_id}') - 1)} {Fore.MAGENTA}║{Style.RESET_ALL}")
-        print(f"{Fore.MAGENTA}║{Style.RESET_ALL} {display_text}{' ' * (width - len(display_text) - 1)} {Fore.MAGENTA}║{Style.RESET_ALL}")
-        print(f"{Fore.MAGENTA}╚{'═' * width}╝{Style.RESET_ALL}")
+        # One write per header instead of one per line
+        sys.stdout.write(self._claim_header_template.format(
+            heading=heading,
+            heading_pad=self._pad(width - len(heading) - 1),
+            text=display_text,
+            text_pad=self._pad(width - len(display_text) - 1)
+        ))
 
     def _print_step_result(self, step_name: str, result: str, status: str = "SUCCESS"):
         """Print step result with status"""
-        colors = {
-            "SUCCESS": Fore.GREEN,
-            "ERROR": Fore.RED,
-            "WARNING": Fore.YELLOW,
-            "PROCESSING": Fore.BLUE
-        }
+        template = _STEP_RESULT_TEMPLATES.get(status)
+        if template is None:
+            template = f"  {Fore.WHITE}[{status}] {{}}: {{}}{Style.RESET_ALL}"
+        print(template.format(step_name, result))
 
-        color = colors.get(status, Fore.WHITE)
-        print(f"  {color}[{status}] {step_name}: {result}{Style.RESET_ALL}")
+    def _print_plain_step_result(self, step_name: str, result: str, status: str = "SUCCESS"):
+        """Print step result as a plain, uncolored line"""
+        print(f"  [{status}] {step_name}: {result}")
 
     def _log_step(self, step: str, status: str = "INFO"):
         """Log a step with colored output"""
-        colors = {
-            "INFO": Fore.CYAN,
-            "SUCCESS": Fore.GREEN,
-            "WARNING": Fore.YELLOW,
-            "ERROR": Fore.RED,
-            "PROCESSING": Fore.BLUE
-        }
-        color = colors.get(status, Fore.WHITE)
-        print(f"{color}[{status}]{Style.RESET_ALL} {step}")
+        prefix = _LOG_STEP_PREFIXES.get(status)
+        if prefix is None:
+            prefix = f"{Fore.WHITE}[{status}]{Style.RESET_ALL}"
+        print(prefix, step)
+
+    def _log_plain_step(self, step: str, status: str = "INFO"):
+        """Log a step as a plain, uncolored line"""
+        print(f"[{status}]", step)
+
+    def _print_section(self, title: str, color: str):
+        """Print a colored section header"""
+        print(f"\n{color}{title}{Style.RESET_ALL}")
+
+    def _print_plain_section(self, title: str, color: str = None):
+        """Print a section header as a plain, uncolored line"""
+        print(f"\n{title}")
+
+    def _cached_call(self, tool_name: str, tool, *args: str, cacheable: Callable[[str], bool] = is_cacheable) -> str:
+        """Call a tool, reusing its result from an earlier run when the on-disk cache is enabled"""
+        if self._disk_cache is None:
+            return tool(*args)
+
+        key = content_key(tool_name, self._cache_namespace, *args)
+        result = self._disk_cache.get(key)
+        if result is None:
+            result = tool(*args)
+            if cacheable(result):
+                self._disk_cache.put(key, result)
+        return result
+
+    @staticmethod
+    def _is_complete_batch(batch: List[Dict[str, str]], batch_result: str) -> bool:
+        """Whether a batch response may be cached: no error and an entry for every requested claim"""
+        if not is_cacheable(batch_result):
+            return False
+        returned_ids = {result.get('claim_id') for result in loads_json(batch_result).get('results', [])}
+        return all(claim["claim_id"] in returned_ids for claim in batch)
+
+    def _retrieve_evidence_batches(self, claims: List[Dict[str, Any]], source_doc_id: str, executor: ThreadPoolExecutor) -> Dict[str, str]:
+        """Retrieve evidence for claims in concurrent batches, returning evidence JSON keyed by claim_id"""
+        batch_size = self.config.evidence_batch_size or len(claims)
+        if batch_size <= 1:
+            return {}
+
+        self._log_step("Retrieving evidence for claims in batches...", "PROCESSING")
+        batches = [
+            [
+                {
+                    "claim_id": claim.get('claim_id', f'claim-{start+offset+1}'),
+                    "claim_text": claim.get('claim_text', '')
+                }
+                for offset, claim in enumerate(claims[start:start+batch_size])
+            ]
+            for start in range(0, len(claims), batch_size)
+        ]
+        results = executor.map(
+            lambda batch: self._cached_call(
+                "retrieve_evidence_batch", self.evidence_retriever_batch, dumps_json(batch), source_doc_id,
+                cacheable=lambda result: self._is_complete_batch(batch, result)
+            ),
+            batches
+        )
+
+        evidence_by_id = {}
+        try:
+            for number, (batch, batch_result) in enumerate(zip(batches, results), start=1):
+                batch_data = loads_json(batch_result)
+                for result in batch_data.get('results', []):
+                    evidence_by_id[result.get('claim_id')] = dumps_json({"evidence": result.get('evidence', [])})
+
+                self._log_step(f"  Evidence batch {number}: {len(batch)} claims", "PROCESSING")
+        except Exception:
+            # Drop the queued batches rather than paying for results that will be thrown away
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+        return evidence_by_id
+
+    def _process_claim(self, claim_text: str, evidence_result: Optional[str], source_doc_id: str, source_metadata: str) -> tuple[Dict, Dict, Dict]:
+        """Run evidence retrieval, judgment and citation building for a single claim"""
+        if evidence_result is None:
+            evidence_result = self._cached_call("retrieve_evidence", self.evidence_retriever, claim_text, source_doc_id)
+
+        judgment_result = self._cached_call("judge_claim", self.decision_judge, claim_text, evidence_result)
+        citation_result = self._cached_call("build_citations", self.citation_builder, evidence_result, source_metadata)
+
+        return loads_json(evidence_result), loads_json(judgment_result), loads_json(citation_result)
+
+    def _build_source_docs_text(self, source_documents: Dict[str, str]) -> str:
+        """
+        Join source documents into one canonical text block.
+
+        Documents are ordered by filename with trailing whitespace stripped, so
+        the same inputs always produce byte-identical text and therefore the
+        same Bedrock prompt-cache key.
+        """
+        if source_documents != self._source_documents:
+            self._source_documents = dict(source_documents)
+            self._source_docs_text = "\n\n--- DOCUMENT SEPARATOR ---\n\n".join(
+                f"=== {filename} ===\n{source_documents[filename].rstrip()}"
+                for filename in sorted(source_documents)
+            )
+        return self._source_docs_text
 
     def load_source_documents(self) -> Dict[str, str]:
         """Load all TXT files from source directory"""
         self._log_step("Loading source documents...", "INFO")
-        source_path = Path(self.config.source_dir)
+        txt_files = list_txt_files(self.config.source_dir)
         documents = {}
 
-        for txt_file in source_path.glob("*.txt"):
-            self._log_step(f"  Reading {txt_file.name}", "PROCESSING")
-            doc_content = load_txt_file(str(txt_file))
-            documents[txt_file.name] = doc_content
+        # Reads release the GIL, so files are loaded concurrently and collected in order
+        with ThreadPoolExecutor(max_workers=max(1, min(32, len(txt_files)))) as executor:
+            contents = executor.map(load_txt_file, [str(txt_file) for txt_file in txt_files])
+            for txt_file, doc_content in zip(txt_files, contents):
+                self._log_step(f"  Reading {txt_file.name}", "PROCESSING")
+                documents[txt_file.name] = doc_content
 
         self._log_step(f"Loaded {len(documents)} source documents", "SUCCESS")
         return documents
 
     def load_target_document(self) -> tuple[str, str]:
-        """Load target document (first TXT file found)"""
+        """Load target document (first TXT file by name)"""
         self._log_step("Loading target document...", "INFO")
-        target_path = Path(self.config.target_dir)
-        txt_files = list(target_path.glob("*.txt"))
+        txt_files = list_txt_files(self.config.target_dir)
 
         if not txt_files:
             raise FileNotFoundError("No TXT files found in target directory")
@@ -155,12 +355,28 @@ class DocumentVerificationOrchestrator:
 
         return target_file.name, content
 
-    def verify_document(self, session_id: str = None) -> str:
+    def flush(self) -> None:
+        """Wait for background result writes to finish, re-raising any write error"""
+        pending, self._pending_saves = self._pending_saves, []
+        for future in pending:
+            future.result()
+
+    def verify_document(self, session_id: str = None) -> tuple[str, Dict[str, Any]]:
         """
-        Main verification workflow that coordinates all specialized agents
+        Main verification workflow that coordinates all specialized agents.
+
+        Returns the path the result is saved to together with the result data,
+        so callers don't need to read the file back. The file is written in the
+        background; call flush() before reading it.
         """
+        from strands import Agent
+
+        # Read the wall clock once for every timestamp of this run; elapsed time is monotonic
+        started_at = datetime.now()
+        start_iso = started_at.isoformat()
+
         if not session_id:
-            session_id = f"sess-{datetime.now().strftime('%Y-%m-%d')}-{str(uuid.uuid4())[:8]}"
+            session_id = f"sess-{started_at.strftime('%Y-%m-%d')}-{str(uuid.uuid4())[:8]}"
 
         # Print welcome banner
         self._print_box(
@@ -176,16 +392,16 @@ class DocumentVerificationOrchestrator:
         )
 
         # Start timing
-        start_time = time.time()
+        start_mono = time.monotonic()
 
         try:
             # Load documents
-            print(f"\n{Fore.YELLOW}LOADING DOCUMENTS{Style.RESET_ALL}")
+            self._print_section("LOADING DOCUMENTS", Fore.YELLOW)
             target_file, target_content = self.load_target_document()
             source_documents = self.load_source_documents()
 
             # Create orchestrator agent with all specialized tools
-            print(f"\n{Fore.BLUE}INITIALIZING AGENTS{Style.RESET_ALL}")
+            self._print_section("INITIALIZING AGENTS", Fore.BLUE)
             self._log_step("Setting up multi-agent pipeline...", "PROCESSING")
             orchestrator = Agent(
                 model=self.model,
@@ -193,6 +409,7 @@ class DocumentVerificationOrchestrator:
                 tools=[
                     self.claim_extractor,
                     self.evidence_retriever,
+                    self.evidence_retriever_batch,
                     self.decision_judge,
                     self.citation_builder
                 ],
@@ -206,26 +423,29 @@ class DocumentVerificationOrchestrator:
 
             # Prepare source documents text
             self._log_step("Preparing source documents for analysis...", "PROCESSING")
-            source_docs_text = "\n\n--- DOCUMENT SEPARATOR ---\n\n".join([
-                f"=== {filename} ===\n{content}"
-                for filename, content in source_documents.items()
-            ])
+            source_docs_text = self._build_source_docs_text(source_documents)
+            prefilter = None
+            if self.config.enable_prefilter:
+                self._log_step("Indexing source documents for prefiltering...", "PROCESSING")
+                prefilter = SourcePrefilter(source_documents)
+            # Every evidence search reuses this corpus, keeping the cached prompt prefix identical;
+            # tool calls refer to it by id rather than carrying the text
+            source_doc_id = self.evidence_retriever_agent.set_source_documents(source_docs_text, prefilter)
 
             # Create user prompt
             self._log_step("Creating analysis prompt...", "PROCESSING")
-            user_prompt = render_prompt(
-                self.prompts["user_prompt"],
+            user_prompt = self._compiled_prompts["user_prompt"].render(
                 {
                     "target_file": target_file,
                     "target_content": target_content,
                     "source_documents": source_docs_text,
                     "session_id": session_id,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": start_iso
                 }
             )
 
             # Execute verification using step-by-step multi-agent workflow
-            print(f"\n{Fore.GREEN}STARTING VERIFICATION WORKFLOW{Style.RESET_ALL}")
+            self._print_section("STARTING VERIFICATION WORKFLOW", Fore.GREEN)
 
             # Step 1: Extract claims
             self._print_box(
@@ -234,224 +454,247 @@ class DocumentVerificationOrchestrator:
                 Fore.GREEN
             )
 
-            claims_result = self.claim_extractor(target_file, target_content)
-            claims_data = json.loads(claims_result)
+            claims_result = self._cached_call("extract_claims", self.claim_extractor, target_file, target_content)
+            claims_data = loads_json(claims_result)
             claim_count = len(claims_data.get('claims', []))
 
             self._print_step_result("Claims Extracted", f"{claim_count} claims found", "SUCCESS")
 
-            # Step 2: Process each claim
-            verified_claims = []
+            # Step 2: Process claims concurrently; each pipeline is independent and Bedrock-bound.
+            # Blocking tool calls run on a bounded thread pool rather than asyncio: the
+            # Strands tools are synchronous, so to_thread would only add an event loop on top.
+            claims = claims_data.get('claims', [])
             total_claims = claim_count
-
-            if total_claims > 0:
-                print(f"\n{Fore.MAGENTA}PROCESSING CLAIMS{Style.RESET_ALL}")
-                self._print_progress_bar(0, total_claims, "Overall Progress")
-
-            for i, claim in enumerate(claims_data.get('claims', [])):
-                claim_text = claim.get('claim_text', '')
-                claim_id = claim.get('claim_id', f'claim-{i+1}')
-
-                # Print fancy claim header
-                self._print_claim_header(claim_id, claim_text, i+1, total_claims)
-
-                # Get evidence for this claim
-                print(f"\n  {Fore.BLUE}Evidence Retrieval{Style.RESET_ALL}")
-                evidence_result = self.evidence_retriever(claim_text, source_docs_text)
-                evidence_data = json.loads(evidence_result)
-                evidence_count = len(evidence_data.get('evidence', []))
-                self._print_step_result("Evidence Search", f"{evidence_count} pieces found", "SUCCESS")
-
-                # Judge the claim
-                print(f"\n  {Fore.MAGENTA}Decision Analysis{Style.RESET_ALL}")
-                judgment_result = self.decision_judge(claim_text, evidence_result)
-                judgment_data = json.loads(judgment_result)
-                interim_verdict = judgment_data.get("verdict", "NOT_FOUND")
-                interim_confidence = judgment_data.get("confidence", 0)
-
-                verdict_color = {
-                    "SUPPORTED": Fore.GREEN,
-                    "CONTRADICTED": Fore.RED,
-                    "PARTIAL": Fore.YELLOW,
-                    "NOT_FOUND": Fore.BLUE
-                }.get(interim_verdict, Fore.WHITE)
-
-                self._print_step_result("Verdict", f"{verdict_color}{interim_verdict}{Style.RESET_ALL}", "SUCCESS")
-                self._print_step_result("Confidence", f"{interim_confidence}%", "SUCCESS")
-
-                # Build citations
-                print(f"\n  {Fore.CYAN}Citation Generation{Style.RESET_ALL}")
-                citation_result = self.citation_builder(evidence_result, json.dumps({
-                    "source_files": list(source_documents.keys())
-                }))
-                citation_data = json.loads(citation_result)
-                citation_count = len(citation_data.get('citations', []))
-                self._print_step_result("Citations", f"{citation_count} generated", "SUCCESS")
-
-                # Extract verdict with fallback
-                verdict = judgment_data.get("verdict", "NOT_FOUND")
-                confidence_raw = judgment_data.get("confidence", 0)
-                rationale = judgment_data.get("rationale", "No rationale provided")
-
-                # Handle potential nested structure
-                if isinstance(verdict, dict):
-                    verdict = "NOT_FOUND"
-
-                # Ensure confidence is numeric
-                if isinstance(confidence_raw, (int, float)):
-                    confidence = int(confidence_raw)
-                elif isinstance(confidence_raw, str):
-                    try:
-                        confidence = int(float(confidence_raw))
-                    except (ValueError, TypeError):
-                        confidence = 0
-                else:
-                    confidence = 0
-
-                # Combine results
-                verified_claim = {
-                    **claim,
-                    "verdict": verdict,
-                    "confidence": confidence,
-                    "rationale": rationale,
-                    "citations": citation_data.get("citations", [])
-                }
-                verified_claims.append(verified_claim)
-
-                # Final result summary for this claim
-                final_verdict_color = {
-                    "SUPPORTED": Fore.GREEN,
-                    "CONTRADICTED": Fore.RED,
-                    "PARTIAL": Fore.YELLOW,
-                    "NOT_FOUND": Fore.BLUE
-                }.get(verdict, Fore.WHITE)
-
-                print(f"\n  {Fore.WHITE}Final Result:{Style.RESET_ALL}")
-                print(f"    {final_verdict_color}[{verdict}] {confidence}% confidence{Style.RESET_ALL}")
-
-                # Update progress bar for completed claim
-                self._print_progress_bar(i+1, total_claims, "Overall Progress")
-                print()  # Empty line for readability
+            # Report-ready claims, built as each one completes and kept in document order
+            final_claims: List[Optional[Claim]] = [None] * total_claims
+
+            source_metadata = dumps_json({
+                "source_files": list(source_documents.keys())
+            })
+
+            with ThreadPoolExecutor(max_workers=max(1, self.config.max_parallel_claims)) as executor:
+                # Claims missing from a batch response fall back to a per-claim search in _process_claim
+                evidence_by_id = {}
+                if total_claims > 0:
+                    evidence_by_id = self._retrieve_evidence_batches(claims, source_doc_id, executor)
+
+                    self._print_section("PROCESSING CLAIMS", Fore.MAGENTA)
+                    self._print_progress_bar(0, total_claims, "Overall Progress")
+
+                submit = executor.submit
+                process_claim = self._process_claim
+                claim_ids = []
+                claim_texts = []
+                futures = {}
+                for i, claim in enumerate(claims):
+                    claim_id = claim.get('claim_id', f'claim-{i+1}')
+                    claim_text = claim.get('claim_text', '')
+                    claim_ids.append(claim_id)
+                    claim_texts.append(claim_text)
+                    future = submit(
+                        process_claim,
+                        claim_text,
+                        evidence_by_id.get(claim_id),
+                        source_doc_id,
+                        source_metadata
+                    )
+                    futures[future] = i
+
+                print_step_result = self._print_step_result
+                interactive = self._interactive
+
+                # Report claims from this thread as they finish so output never interleaves
+                try:
+                    for completed, future in enumerate(as_completed(futures), start=1):
+                        i = futures[future]
+                        claim_id = claim_ids[i]
+                        claim_text = claim_texts[i]
+                        evidence_data, judgment_data, citation_data = future.result()
+
+                        # Extract verdict with fallback
+                        verdict = judgment_data.get("verdict", "NOT_FOUND")
+                        confidence_raw = judgment_data.get("confidence", 0)
+                        rationale = judgment_data.get("rationale", "No rationale provided")
+
+                        # Handle potential nested structure
+                        if isinstance(verdict, dict):
+                            verdict = "NOT_FOUND"
+
+                        # Ensure confidence is numeric
+                        if isinstance(confidence_raw, (int, float)):
+                            confidence = int(confidence_raw)
+                        elif isinstance(confidence_raw, str):
+                            try:
+                                confidence = int(float(confidence_raw))
+                            except (ValueError, TypeError):
+                                confidence = 0
+                        else:
+                            confidence = 0
+
+                        citations = citation_data.get("citations", [])
+
+                        # Convert claim to final format. Sub-agent JSON was validated against its
+                        # structured-output model at the tool boundary and verdict/confidence were
+                        # normalized above, so the report models are built with model_construct.
+                        final_claims[i] = Claim.model_construct(
+                            claim_id=claim_id,
+                            title=f"Claim: {claim_text[:50]}...",
+                            description=claim_text,
+                            details=ClaimDetails.model_construct(
+                                claimText=claim_text,
+                                targetLocator=TargetLocator.model_construct(**claims[i].get('target_locator', {})),
+                                verdict=verdict,
+                                confidence=confidence,
+                                rationale=rationale,
+                                citations=[Citation.model_construct(**citation) for citation in citations]
+                            ),
+                            priority="high",
+                            dependencies=[],
+                            status="completed"
+                        )
+
+                        evidence_count = len(evidence_data.get('evidence', []))
+                        citation_count = len(citations)
+
+                        if not interactive:
+                            # One plain line per claim for logs, pipes and NO_COLOR terminals
+                            print(f"[CLAIM {completed}/{total_claims}] {claim_id}: {verdict} {confidence}% "
+                                  f"({evidence_count} evidence, {citation_count} citations)")
+                            continue
+
+                        # Print fancy claim header
+                        self._print_claim_header(claim_id, claim_text, i+1, completed, total_claims)
+
+                        print(f"\n  {Fore.BLUE}Evidence Retrieval{Style.RESET_ALL}")
+                        print_step_result("Evidence Search", f"{evidence_count} pieces found", "SUCCESS")
+
+                        print(f"\n  {Fore.MAGENTA}Decision Analysis{Style.RESET_ALL}")
+                        interim_verdict = judgment_data.get("verdict", "NOT_FOUND")
+                        interim_confidence = judgment_data.get("confidence", 0)
+
+                        verdict_color = _VERDICT_COLOR.get(interim_verdict, Fore.WHITE)
+
+                        print_step_result("Verdict", f"{verdict_color}{interim_verdict}{Style.RESET_ALL}", "SUCCESS")
+                        print_step_result("Confidence", f"{interim_confidence}%", "SUCCESS")
+
+                        print(f"\n  {Fore.CYAN}Citation Generation{Style.RESET_ALL}")
+                        print_step_result("Citations", f"{citation_count} generated", "SUCCESS")
+
+                        # Final result summary for this claim
+                        final_verdict_color = _VERDICT_COLOR.get(verdict, Fore.WHITE)
+
+                        print(f"\n  {Fore.WHITE}Final Result:{Style.RESET_ALL}")
+                        print(f"    {final_verdict_color}[{verdict}] {confidence}% confidence{Style.RESET_ALL}")
+
+                        # Update progress bar for completed claim
+                        self._print_progress_bar(completed, total_claims, "Overall Progress")
+                        print()  # Empty line for readability
+                except Exception:
+                    # Stop at the first failed claim, as the sequential loop did, instead of
+                    # waiting for every queued claim's Bedrock calls before reporting it
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
 
             # Step 3: Aggregate results into final structure
-            print(f"\n{Fore.GREEN}BUILDING FINAL REPORT{Style.RESET_ALL}")
+            self._print_section("BUILDING FINAL REPORT", Fore.GREEN)
             self._print_box(
                 "STEP 3: REPORT GENERATION",
                 ["Aggregating results and generating final report..."],
                 Fore.GREEN
             )
 
-            # Group claims by category into blocks
-            blocks = {}
-            for claim in verified_claims:
-                category = claim.get('category', 'General')
-                if category not in blocks:
-                    blocks[category] = {
-                        "block_id": f"block-{len(blocks)+1:02d}",
-                        "title": f"Block: {category}",
-                        "description": f"Claims related to {category.lower()}",
-                        "details": {"pageRange": [1, 50]},
-                        "priority": "high",
-                        "status": "completed",
-                        "claims": []
-                    }
-
-                # Convert claim to final format
-                final_claim = {
-                    "claim_id": claim.get('claim_id'),
-                    "title": f"Claim: {claim.get('claim_text', '')[:50]}...",
-                    "description": claim.get('claim_text', ''),
-                    "details": {
-                        "claimText": claim.get('claim_text', ''),
-                        "targetLocator": claim.get('target_locator', {}),
-                        "verdict": claim.get('verdict', 'NOT_FOUND'),
-                        "confidence": claim.get('confidence', 0),
-                        "rationale": claim.get('rationale', ''),
-                        "citations": claim.get('citations', [])
-                    },
-                    "priority": "high",
-                    "dependencies": [],
-                    "status": "completed"
-                }
-                blocks[category]["claims"].append(final_claim)
+            # Group claims by category (first-seen order), then shape each group into a block
+            claims_by_category: defaultdict[str, List[Claim]] = defaultdict(list)
+            for claim, final_claim in zip(claims, final_claims):
+                claims_by_category[claim.get('category', 'General')].append(final_claim)
+
+            blocks = [
+                Block.model_construct(
+                    block_id=f"block-{index:02d}",
+                    title=f"Block: {category}",
+                    description=f"Claims related to {category.lower()}",
+                    details=BlockDetails.model_construct(pageRange=[1, 50]),
+                    priority="high",
+                    status="completed",
+                    claims=category_claims
+                )
+                for index, (category, category_claims) in enumerate(claims_by_category.items(), start=1)
+            ]
 
             # Create final result structure
-            result_data = {
-                "document_id": session_id,
-                "title": f"{target_file} Verification vs Sources",
-                "description": f"Target: {target_file} is verified against source documents",
-                "details": {
-                    "sourceDocuments": [
-                        {"docId": filename, "version": 1, "kind": "source_document"}
+            result = VerificationResult.model_construct(
+                document_id=session_id,
+                title=f"{target_file} Verification vs Sources",
+                description=f"Target: {target_file} is verified against source documents",
+                details=Details.model_construct(
+                    sourceDocuments=[
+                        SourceDocument.model_construct(docId=filename, version=1, kind="source_document")
                         for filename in source_documents.keys()
                     ]
-                },
-                "priority": "high",
-                "dependencies": [],
-                "status": "completed",
-                "blocks": list(blocks.values()),
-                "audit": {
-                    "createdBy": "strands-verifier",
-                    "createdAt": datetime.now().isoformat(),
-                    "reviewStage": "automated",
-                    "notes": "Automated verification using multi-agent analysis"
-                }
-            }
+                ),
+                priority="high",
+                dependencies=[],
+                status="completed",
+                blocks=blocks,
+                audit=Audit.model_construct(
+                    createdBy="strands-verifier",
+                    createdAt=start_iso,
+                    reviewStage="automated",
+                    notes="Automated verification using multi-agent analysis"
+                )
+            )
 
             # Save result
             self._log_step("Processing verification results...", "INFO")
             result_path = f"{self.config.results_dir}/{session_id}.json"
 
             # Calculate performance metrics
-            end_time = time.time()
-            total_time = end_time - start_time
+            total_time = time.monotonic() - start_mono
 
             # Add performance data to result
-            result_data["performance"] = {
-                "total_time_seconds": round(total_time, 2),
-                "claims_processed": len(verified_claims),
-                "avg_time_per_claim": round(total_time / max(len(verified_claims), 1), 2),
-                "caching_enabled": self.config.enable_caching
-            }
+            result.performance = Performance.model_construct(
+                total_time_seconds=round(total_time, 2),
+                claims_processed=total_claims,
+                avg_time_per_claim=round(total_time / max(total_claims, 1), 2),
+                caching_enabled=self.config.enable_caching
+            )
 
-            # Save the assembled result
-            save_json_result(result_data, result_path)
+            # Save the assembled result, serialized straight from the models, off the critical path
+            self._pending_saves.append(self._writer.submit(save_model_result, result, result_path))
 
             # Performance summary with fancy UI
-            print(f"\n{Fore.GREEN}VERIFICATION COMPLETE{Style.RESET_ALL}")
+            self._print_section("VERIFICATION COMPLETE", Fore.GREEN)
 
-            # Count verdicts for summary
-            verdict_counts = {"SUPPORTED": 0, "CONTRADICTED": 0, "PARTIAL": 0, "NOT_FOUND": 0}
-            for claim in verified_claims:
-                verdict = claim.get("verdict", "NOT_FOUND")
-                verdict_counts[verdict] = verdict_counts.get(verdict, 0) + 1
+            # Count verdicts for summary (Counter reports 0 for verdicts that never occurred)
+            verdict_counts = Counter(claim.details.verdict for claim in final_claims)
 
             self._print_box(
                 "VERIFICATION SUMMARY",
                 [
-                    f"Total Claims: {len(verified_claims)}",
+                    f"Total Claims: {total_claims}",
                     f"Supported: {verdict_counts['SUPPORTED']}",
                     f"Contradicted: {verdict_counts['CONTRADICTED']}",
                     f"Partial: {verdict_counts['PARTIAL']}",
                     f"Not Found: {verdict_counts['NOT_FOUND']}",
                     "",
                     f"Total Time: {total_time:.2f}s",
-                    f"Avg/Claim: {total_time / max(len(verified_claims), 1):.2f}s",
+                    f"Avg/Claim: {total_time / max(total_claims, 1):.2f}s",
                     f"Results: {result_path}"
                 ],
                 Fore.GREEN
             )
 
-            return result_path
+            return result_path, result.model_dump()
 
         except Exception as e:
-            print(f"\n{Fore.RED}VERIFICATION FAILED{Style.RESET_ALL}")
+            failed_at = datetime.now().isoformat()
+            self._print_section("VERIFICATION FAILED", Fore.RED)
             self._print_box(
                 "ERROR DETAILS",
                 [
                     f"Session: {session_id}",
                     f"Error: {str(e)}",
-                    f"Time: {datetime.now().isoformat()}"
+                    f"Time: {failed_at}"
                 ],
                 Fore.RED
             )
@@ -459,8 +702,8 @@ class DocumentVerificationOrchestrator:
             error_result = {
                 "document_id": session_id,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": failed_at
             }
             error_path = f"{self.config.results_dir}/{session_id}_error.json"
             save_json_result(error_result, error_path)
-            return error_path
\ No newline at end of file
+            return error_path, error_result
\ No newline at end of file
@@ -0,0 +1,62 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+def content_key(*parts: str) -> str:
+    """Compact digest of the given strings, used as a cache key for long inputs"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x1f")  # Unit separator keeps ("ab", "c") and ("a", "bc") apart
+    return digest.hexdigest()
+
+def is_cacheable(result: str) -> bool:
+    """Whether a tool result may be reused: errors and fallback outputs are retried on the next call"""
+    return not result.startswith(('{"error"', '{"fallback"'))
+
+class ResultCache:
+    """Thread-safe, bounded LRU cache of tool results keyed by content_key"""
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached result for key, or None on a miss"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        """Store a result, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+class DiskResultCache:
+    """Tool results stored as one file per content_key, reused across runs"""
+    def __init__(self, directory: str):
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored result for key, or None on a miss"""
+        try:
+            return (self.directory / f"{key}.json").read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, value: str) -> None:
+        """Store a result, writing to a temporary file first so readers never see partial output"""
+        path = self.directory / f"{key}.json"
+        tmp_path = path.with_name(f"{key}.{os.getpid()}-{threading.get_ident()}.tmp")
+        tmp_path.write_text(value, encoding="utf-8")
+        os.replace(tmp_path, path)
+
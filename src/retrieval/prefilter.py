@@ -0,0 +1,51 @@
+import heapq
+import re
+from typing import Dict, List
+
+_TOKEN = re.compile(r"\w+")
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens used for BM25 scoring"""
+    return _TOKEN.findall(text.lower())
+
+class SourcePrefilter:
+    """
+    BM25 index over paragraph chunks of the source documents.
+
+    Built once per corpus and shared by every evidence search, so each claim
+    sends the LLM only its most relevant chunks instead of the whole corpus.
+    """
+    def __init__(self, source_documents: Dict[str, str]):
+        from rank_bm25 import BM25Okapi
+
+        self._chunks: List[str] = []
+        tokens: List[List[str]] = []
+        for filename in sorted(source_documents):
+            paragraph: List[str] = []
+            start = 0
+            # A trailing blank line flushes the last paragraph
+            for number, line in enumerate(source_documents[filename].splitlines() + [""], start=1):
+                if line.strip():
+                    if not paragraph:
+                        start = number
+                    paragraph.append(line)
+                elif paragraph:
+                    text = "\n".join(paragraph)
+                    self._chunks.append(f"=== {filename} (line {start}) ===\n{text}")
+                    tokens.append(tokenize(text))
+                    paragraph = []
+
+        # BM25Okapi can't be built over an empty corpus
+        self._bm25 = BM25Okapi(tokens) if tokens else None
+
+    def excerpt(self, queries: List[str], top_n: int) -> str:
+        """Join the top_n chunks for each query, merged and kept in document order"""
+        if self._bm25 is None:
+            return ""
+
+        selected = set()
+        for query in queries:
+            scores = self._bm25.get_scores(tokenize(query))
+            selected.update(heapq.nlargest(top_n, range(len(scores)), key=scores.__getitem__))
+
+        return "\n\n".join(self._chunks[i] for i in sorted(selected))
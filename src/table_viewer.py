@@ -1,54 +1,94 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Iterable, Iterator, BinaryIO, Sequence
 from colorama import Fore, Style, init
+from collections import Counter
+import itertools
 import json
-from prettytable import PrettyTable
+import re
+import sys
+import unicodedata
+from pathlib import Path
+from src.utils import loads_json
+
+try:
+    import ijson
+except ImportError:  # Without ijson, large results are loaded whole like any other
+    ijson = None
 
 init(autoreset=True)
 
-class VerificationTableViewer:
-    def __init__(self):
-        self.verdict_colors = {
-            "SUPPORTED": Fore.GREEN + "Pass" + Style.RESET_ALL,
-            "CONTRADICTED": Fore.RED + "Fail" + Style.RESET_ALL,
-            "PARTIAL": Fore.YELLOW + "Partial" + Style.RESET_ALL,
-            "NOT_FOUND": Fore.BLUE + "Not Found" + Style.RESET_ALL
-        }
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+_DASH_TO_DOT = str.maketrans('-', '.')
 
+# Result files above this size are stream-parsed block by block when ijson is installed
+_STREAM_THRESHOLD = 16 * 1024 * 1024
 
-    def format_status(self, verdict: str) -> str:
+class VerificationTableViewer:
+    # Row pieces that never change, built once instead of per row
+    _CYAN_DASH = f"{Fore.CYAN}-{Style.RESET_ALL}"
+    _SEP_ROW = ["-" * 8, "-" * 45, "-" * 12, "-" * 8, "-" * 30]
+    _SEP_WIDTHS = [len(sep) for sep in _SEP_ROW]
+    # Column headers and alignment (l/c/r) for the claims and metric tables
+    _CLAIM_FIELDS = ["ID", "Block/Claim", "Status", "Confidence", "Dependencies"]
+    _CLAIM_ALIGN = ["c", "l", "c", "c", "l"]
+    _METRIC_FIELDS = ["Metric", "Value"]
+    _METRIC_ALIGN = ["l", "r"]
+    # Colored summary labels
+    _LABEL_PASS = f"{Fore.GREEN}Pass (Supported){Style.RESET_ALL}"
+    _LABEL_FAIL = f"{Fore.RED}Fail (Contradicted){Style.RESET_ALL}"
+    _LABEL_PARTIAL = f"{Fore.YELLOW}Partial{Style.RESET_ALL}"
+    _LABEL_NOT_FOUND = f"{Fore.BLUE}Not Found{Style.RESET_ALL}"
+    # Claims table rows printed per page; the header repeats on each page
+    _PAGE_SIZE = 50
+
+    verdict_colors = {
+        "SUPPORTED": Fore.GREEN + "Pass" + Style.RESET_ALL,
+        "CONTRADICTED": Fore.RED + "Fail" + Style.RESET_ALL,
+        "PARTIAL": Fore.YELLOW + "Partial" + Style.RESET_ALL,
+        "NOT_FOUND": Fore.BLUE + "Not Found" + Style.RESET_ALL
+    }
+
+    @classmethod
+    def format_status(cls, verdict: str) -> str:
         """Format verdict as colored status"""
-        return self.verdict_colors.get(verdict, verdict)
+        return cls.verdict_colors.get(verdict, verdict)
 
-    def get_display_length(self, text: str) -> int:
+    @staticmethod
+    def get_display_length(text: str) -> int:
         """Get the actual display length of text (excluding ANSI color codes)"""
-        import re
-        # Remove ANSI escape sequences
-        ansi_escape = re.compile(r'\x1b\[[0-9;]*m')
-        clean_text = ansi_escape.sub('', text)
-        return len(clean_text)
-
-
-    def truncate_text(self, text: str, max_length: int = 40) -> str:
+        # Most cells are plain text; only run the regex when an escape byte is present
+        if '\x1b' in text:
+            # Remove ANSI escape sequences
+            text = _ANSI_RE.sub('', text)
+        if text.isascii():
+            return len(text)
+        # Wide characters (e.g. Hangul, CJK) take two terminal columns
+        return sum(2 if unicodedata.east_asian_width(ch) in ('W', 'F') else 1 for ch in text)
+
+
+    @staticmethod
+    def truncate_text(text: str, max_length: int = 40) -> str:
         """Truncate text to fit in table columns"""
         if len(text) <= max_length:
             return text
         return text[:max_length-3] + "..."
 
-    def extract_citations_summary(self, citations: List[Dict]) -> str:
+    @staticmethod
+    def extract_citations_summary(citations: List[Dict]) -> str:
         """Extract summary of citations for dependencies column"""
         if not citations:
             return "-"
 
         summaries = []
         for citation in citations[:2]:  # Show max 2 citations
-            doc_id = citation.get("docId", "").replace(".txt", "")
+            doc_id = citation.get("docId", "").removesuffix(".txt")
             version = citation.get("version", "")
             page = citation.get("page", "")
 
             if doc_id and page:
-                if "rfp" in doc_id.lower():
+                doc_id_lower = doc_id.lower()
+                if "rfp" in doc_id_lower:
                     summaries.append(f"RFP v{version} p{page}")
-                elif "internal" in doc_id.lower() or "spec" in doc_id.lower():
+                elif "internal" in doc_id_lower or "spec" in doc_id_lower:
                     summaries.append(f"Internal Spec v{version}, p{page}")
                 else:
                     summaries.append(f"{doc_id} v{version} p{page}")
@@ -60,42 +100,103 @@ class VerificationTableViewer:
         return result if result else "-"
 
 
-    def display_verification_table(self, result_data: Dict[str, Any]):
-        """Display verification results as a formatted table using PrettyTable"""
-        print(f"\n{Fore.GREEN}{'='*100}")
-        print(f"VERIFICATION RESULTS TABLE")
-        print(f"Document: {result_data.get('title', 'Unknown')}")
-        print(f"Session: {result_data.get('document_id', 'Unknown')}")
-        print(f"{'='*100}{Style.RESET_ALL}")
-
-        # Create main table
-        table = PrettyTable()
-        table.field_names = ["ID", "Block/Claim", "Status", "Confidence", "Dependencies"]
-        table.align["Block/Claim"] = "l"
-        table.align["Dependencies"] = "l"
-        table.max_width["Block/Claim"] = 45
-        table.max_width["Dependencies"] = 30
+    @classmethod
+    def format_table(cls, field_names: Sequence[str], rows: List[List[str]], align: Sequence[str], min_widths: Optional[Sequence[int]] = None) -> str:
+        """
+        Render rows as a bordered text table.
+
+        Column widths are measured once over the header and cells (ignoring ANSI
+        color codes). Each column's align entry is "l", "r" or "c" (centered
+        the way str.center pads). min_widths optionally sets a floor per column.
+        """
+        widths = [cls.get_display_length(name) for name in field_names]
+        if min_widths:
+            widths = [max(width, floor) for width, floor in zip(widths, min_widths)]
+        row_lengths = [[cls.get_display_length(cell) for cell in row] for row in rows]
+        for lengths in row_lengths:
+            widths = [max(width, length) for width, length in zip(widths, lengths)]
+
+        def format_row(cells: Sequence[str], lengths: Sequence[int]) -> str:
+            parts = []
+            for cell, length, width, how in zip(cells, lengths, widths, align):
+                excess = width - length
+                if how == "l":
+                    parts.append(cell + " " * excess)
+                elif how == "r":
+                    parts.append(" " * excess + cell)
+                else:
+                    left = excess // 2 + (excess & width & 1)
+                    parts.append(" " * left + cell + " " * (excess - left))
+            return "| " + " | ".join(parts) + " |"
+
+        border = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+        lines = [border, format_row(field_names, [cls.get_display_length(name) for name in field_names]), border]
+        lines.extend(format_row(row, lengths) for row, lengths in zip(rows, row_lengths))
+        lines.append(border)
+        return "\n".join(lines)
+
+    @classmethod
+    def _format_claims_table(cls, rows: List[List[str]], min_widths: Sequence[int]) -> str:
+        """Render one page of the claims table with columns at least min_widths wide"""
+        return cls.format_table(cls._CLAIM_FIELDS, rows, cls._CLAIM_ALIGN, min_widths)
+
+    @classmethod
+    def display_verification_table(cls, result_data: Dict[str, Any], blocks: Optional[Iterable[Dict[str, Any]]] = None):
+        """
+        Display verification results as a formatted table.
+
+        blocks may be an iterator that yields blocks as they are parsed;
+        it defaults to result_data['blocks'].
+        """
+        # Output is collected in lines and written once per page instead of print per line
+        lines = [
+            f"\n{Fore.GREEN}{'='*100}",
+            f"VERIFICATION RESULTS TABLE",
+            f"Document: {result_data.get('title', 'Unknown')}",
+            f"Session: {result_data.get('document_id', 'Unknown')}",
+            f"{'='*100}{Style.RESET_ALL}",
+        ]
+
+        if blocks is None:
+            blocks = result_data.get('blocks', [])
+
+        # Counted while building rows so the summary doesn't walk the claims again
+        verdict_counts = {"SUPPORTED": 0, "CONTRADICTED": 0, "PARTIAL": 0, "NOT_FOUND": 0}
+        total_claims = 0
 
-        blocks = result_data.get('blocks', [])
+        # Rows are printed a page at a time so large reports start rendering right away
+        rows: List[List[str]] = []
+        # Closing border of the last printed page, held back while another page may follow
+        open_border = None
+        # Every page is at least as wide as the separator row and the pages before it,
+        # so pages line up unless a later page holds a wider cell
+        min_widths = cls._SEP_WIDTHS
+        # Same lookup as format_status, bound once for the row loop
+        status_of = cls.verdict_colors.get
 
         for i, block in enumerate(blocks):
+            # Add separator between blocks, unless a new page just started
+            if i > 0 and rows:
+                rows.append(cls._SEP_ROW)
+
             block_id = block.get('block_id', '').upper()
-            block_title = block.get('title', 'Unknown Block').replace("Block: ", "")
+            block_title = block.get('title', 'Unknown Block').removeprefix("Block: ")
 
             # Add block header row
-            table.add_row([
+            cyan_dash = cls._CYAN_DASH
+            rows.append([
                 f"{Fore.CYAN}{block_id}{Style.RESET_ALL}",
-                f"{Fore.CYAN}{self.truncate_text(block_title, 45)}{Style.RESET_ALL}",
-                f"{Fore.CYAN}-{Style.RESET_ALL}",
-                f"{Fore.CYAN}-{Style.RESET_ALL}",
-                f"{Fore.CYAN}-{Style.RESET_ALL}"
+                f"{Fore.CYAN}{cls.truncate_text(block_title, 45)}{Style.RESET_ALL}",
+                cyan_dash,
+                cyan_dash,
+                cyan_dash
             ])
 
             # Add claims under this block
             claims = block.get('claims', [])
             for claim in claims:
-                claim_id = claim.get('claim_id', '').replace('claim-', '').replace('-', '.')
-                claim_title = claim.get('title', 'Unknown Claim').replace("Claim: ", "")
+                claim_id = claim.get('claim_id', '').removeprefix('claim-').translate(_DASH_TO_DOT)
+                claim_title = claim.get('title', 'Unknown Claim').removeprefix("Claim: ")
                 if claim_title.endswith("..."):
                     claim_title = claim_title[:-3]
 
@@ -103,84 +204,142 @@ class VerificationTableViewer:
                 verdict = claim_details.get('verdict', 'NOT_FOUND')
                 confidence = claim_details.get('confidence', 0)
                 citations = claim_details.get('citations', [])
+                verdict_counts[verdict] = verdict_counts.get(verdict, 0) + 1
+                total_claims += 1
 
-                formatted_status = self.format_status(verdict)
-                dependencies = self.extract_citations_summary(citations)
+                formatted_status = status_of(verdict, verdict)
+                dependencies = cls.extract_citations_summary(citations)
 
-                table.add_row([
+                rows.append([
                     f"  {claim_id}",
-                    f"└─ {self.truncate_text(claim_title, 40)}",
+                    f"└─ {cls.truncate_text(claim_title, 40)}",
                     formatted_status,
                     f"{confidence}%",
-                    self.truncate_text(dependencies, 28)
+                    cls.truncate_text(dependencies, 28)
                 ])
 
-            # Add separator between blocks (except after last block)
-            if i < len(blocks) - 1:
-                table.add_row(["-" * 8, "-" * 45, "-" * 12, "-" * 8, "-" * 30])
-
-        print(table)
-
-        # Print summary statistics
-        self.print_summary_stats(result_data)
-
-    def print_summary_stats(self, result_data: Dict[str, Any]):
-        """Print summary statistics using PrettyTable"""
-        # Count verdicts
-        verdict_counts = {"SUPPORTED": 0, "CONTRADICTED": 0, "PARTIAL": 0, "NOT_FOUND": 0}
-        total_claims = 0
-
-        for block in result_data.get('blocks', []):
-            for claim in block.get('claims', []):
-                verdict = claim.get('details', {}).get('verdict', 'NOT_FOUND')
-                verdict_counts[verdict] = verdict_counts.get(verdict, 0) + 1
-                total_claims += 1
+                if len(rows) >= cls._PAGE_SIZE:
+                    page, open_border = cls._format_claims_table(rows, min_widths).rsplit("\n", 1)
+                    min_widths = [len(dashes) - 2 for dashes in open_border[1:-1].split("+")]
+                    lines.append(page)
+                    cls._write_lines(lines)
+                    lines, rows = [], []
+
+        if rows or open_border is None:
+            lines.append(cls._format_claims_table(rows, min_widths))
+        else:
+            lines.append(open_border)
+
+        # Summary statistics go out in the same write as the last page
+        lines.extend(cls._summary_lines(result_data, verdict_counts, total_claims))
+        cls._write_lines(lines)
+
+    @staticmethod
+    def _write_lines(lines: List[str]):
+        """Write lines to stdout in a single call"""
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+
+    @classmethod
+    def print_summary_stats(cls, result_data: Dict[str, Any], verdict_counts: Optional[Dict[str, int]] = None, total_claims: Optional[int] = None):
+        """Print summary statistics"""
+        cls._write_lines(cls._summary_lines(result_data, verdict_counts, total_claims))
+
+    @classmethod
+    def _summary_lines(cls, result_data: Dict[str, Any], verdict_counts: Optional[Dict[str, int]] = None, total_claims: Optional[int] = None) -> List[str]:
+        """Render the summary (and performance, if present) tables as output lines"""
+        # Count verdicts unless the caller already did
+        if verdict_counts is None or total_claims is None:
+            # Counter reports 0 for verdicts that never occur
+            verdict_counts = Counter(
+                claim.get('details', {}).get('verdict', 'NOT_FOUND')
+                for block in result_data.get('blocks', ())
+                for claim in block.get('claims', ())
+            )
+            total_claims = sum(verdict_counts.values())
 
         # Create summary table
-        print(f"\n{Fore.CYAN}SUMMARY STATISTICS:{Style.RESET_ALL}")
-        summary_table = PrettyTable()
-        summary_table.field_names = ["Metric", "Value"]
-        summary_table.align["Metric"] = "l"
-        summary_table.align["Value"] = "r"
-
-        summary_table.add_row(["Total Claims", str(total_claims)])
-        summary_table.add_row([f"{Fore.GREEN}Pass (Supported){Style.RESET_ALL}", str(verdict_counts['SUPPORTED'])])
-        summary_table.add_row([f"{Fore.RED}Fail (Contradicted){Style.RESET_ALL}", str(verdict_counts['CONTRADICTED'])])
-        summary_table.add_row([f"{Fore.YELLOW}Partial{Style.RESET_ALL}", str(verdict_counts['PARTIAL'])])
-        summary_table.add_row([f"{Fore.BLUE}Not Found{Style.RESET_ALL}", str(verdict_counts['NOT_FOUND'])])
+        lines = [f"\n{Fore.CYAN}SUMMARY STATISTICS:{Style.RESET_ALL}"]
+        summary_rows = [
+            ["Total Claims", str(total_claims)],
+            [cls._LABEL_PASS, str(verdict_counts['SUPPORTED'])],
+            [cls._LABEL_FAIL, str(verdict_counts['CONTRADICTED'])],
+            [cls._LABEL_PARTIAL, str(verdict_counts['PARTIAL'])],
+            [cls._LABEL_NOT_FOUND, str(verdict_counts['NOT_FOUND'])],
+        ]
 
         # Calculate pass rate
         pass_rate = ((verdict_counts['SUPPORTED'] + verdict_counts['PARTIAL']) / max(total_claims, 1)) * 100
-        summary_table.add_row(["Overall Pass Rate", f"{pass_rate:.1f}%"])
+        summary_rows.append(["Overall Pass Rate", f"{pass_rate:.1f}%"])
 
-        print(summary_table)
+        lines.append(cls.format_table(cls._METRIC_FIELDS, summary_rows, cls._METRIC_ALIGN))
 
         # Performance info if available
         performance = result_data.get('performance', {})
         if performance:
-            print(f"\n{Fore.CYAN}PERFORMANCE METRICS:{Style.RESET_ALL}")
-            perf_table = PrettyTable()
-            perf_table.field_names = ["Metric", "Value"]
-            perf_table.align["Metric"] = "l"
-            perf_table.align["Value"] = "r"
-
-            perf_table.add_row(["Total Time", f"{performance.get('total_time_seconds', 0):.2f} seconds"])
-            perf_table.add_row(["Avg Time/Claim", f"{performance.get('avg_time_per_claim', 0):.2f} seconds"])
+            lines.append(f"\n{Fore.CYAN}PERFORMANCE METRICS:{Style.RESET_ALL}")
+            perf_rows = [
+                ["Total Time", f"{performance.get('total_time_seconds', 0):.2f} seconds"],
+                ["Avg Time/Claim", f"{performance.get('avg_time_per_claim', 0):.2f} seconds"],
+            ]
 
             caching_status = "ENABLED" if performance.get('caching_enabled', False) else "DISABLED"
             cache_color = Fore.GREEN if performance.get('caching_enabled', False) else Fore.RED
-            perf_table.add_row(["Caching", f"{cache_color}{caching_status}{Style.RESET_ALL}"])
-
-            print(perf_table)
+            perf_rows.append(["Caching", f"{cache_color}{caching_status}{Style.RESET_ALL}"])
+
+            lines.append(cls.format_table(cls._METRIC_FIELDS, perf_rows, cls._METRIC_ALIGN))
+
+        return lines
+
+def _stream_blocks(file: BinaryIO, fields: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield result blocks one at a time while parsing the file incrementally.
+
+    Other top-level fields are stored in fields as they are reached, so header
+    fields written before the blocks are available once the first block is
+    yielded and trailing ones (performance) once iteration finishes.
+    """
+    builder = None
+    target = None
+    for prefix, event, value in ijson.parse(file, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == target and event in ("end_map", "end_array"):
+                if target == "blocks.item":
+                    yield builder.value
+                else:
+                    fields[target] = builder.value
+                builder = None
+        elif prefix == "blocks.item" and event == "start_map":
+            builder, target = ijson.ObjectBuilder(), prefix
+            builder.event(event, value)
+        elif prefix not in ("", "blocks") and "." not in prefix:
+            if event in ("start_map", "start_array"):
+                builder, target = ijson.ObjectBuilder(), prefix
+                builder.event(event, value)
+            else:
+                fields[prefix] = value
 
 def load_and_display_results(json_file_path: str):
     """Load JSON file and display as table"""
     try:
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            result_data = json.load(f)
+        path = Path(json_file_path)
+
+        if ijson is not None and path.stat().st_size > _STREAM_THRESHOLD:
+            # Large results: render blocks as they are parsed instead of loading the whole file
+            with open(path, 'rb') as f:
+                result_data: Dict[str, Any] = {}
+                blocks = _stream_blocks(f, result_data)
+                first_block = next(blocks, None)  # Parse up to the first block to read the header fields
+                if first_block is not None:
+                    blocks = itertools.chain([first_block], blocks)
+                VerificationTableViewer.display_verification_table(result_data, blocks)
+            return
+
+        # Parsed from bytes, so orjson (when installed) skips text decoding
+        result_data = loads_json(path.read_bytes())
 
-        viewer = VerificationTableViewer()
-        viewer.display_verification_table(result_data)
+        VerificationTableViewer.display_verification_table(result_data)
 
     except FileNotFoundError:
         print(f"{Fore.RED}Error: File '{json_file_path}' not found{Style.RESET_ALL}")
@@ -190,8 +349,7 @@ def load_and_display_results(json_file_path: str):
         print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
 
 if __name__ == "__main__":
-    import sys
     if len(sys.argv) > 1:
         load_and_display_results(sys.argv[1])
     else:
-        print("Usage: python table_viewer.py <json_file_path>")
\ No newline at end of file
+        print("Usage: python -m src.table_viewer <json_file_path>")
\ No newline at end of file
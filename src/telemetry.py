@@ -1,11 +1,12 @@
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.resources import Resource
 from src.config import Config
 import os
 
+# Shared by setup_telemetry and TelemetryMixin; the API proxy picks up the provider once it is set
+_tracer = trace.get_tracer("strands-verifier")
+
 def setup_telemetry(config: Config) -> trace.Tracer:
     """
     Set up OpenTelemetry tracing with Arize integration
@@ -23,6 +24,11 @@ def setup_telemetry(config: Config) -> trace.Tracer:
 
     # Configure OTLP exporter for Arize
     if config.arize_space_id and config.arize_api_key:
+        # Imported here so runs without Arize credentials never load gRPC/protobuf
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+        from grpc import Compression
+
         # Set environment variables for Arize
         os.environ["ARIZE_SPACE_ID"] = config.arize_space_id
         os.environ["ARIZE_API_KEY"] = config.arize_api_key
@@ -34,27 +40,32 @@ def setup_telemetry(config: Config) -> trace.Tracer:
             headers={
                 "space_id": config.arize_space_id,
                 "api_key": config.arize_api_key
-            }
+            },
+            compression=Compression.Gzip
         )
 
-        span_processor = BatchSpanProcessor(otlp_exporter)
+        # A larger queue drops fewer spans on busy runs; the shorter delay exports
+        # spans sooner at the cost of more export calls
+        span_processor = BatchSpanProcessor(
+            otlp_exporter,
+            max_queue_size=4096,
+            schedule_delay_millis=2000
+        )
         tracer_provider.add_span_processor(span_processor)
 
     # Return tracer
-    return trace.get_tracer("strands-verifier")
+    return _tracer
 
 class TelemetryMixin:
     """
     Mixin class to add telemetry capabilities to agents
     """
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.tracer = trace.get_tracer("strands-verifier")
+    # One tracer shared by every instance
+    tracer = _tracer
 
     def create_span(self, name: str, attributes: dict = None):
         """Create a new span with optional attributes"""
         span = self.tracer.start_span(name)
         if attributes:
-            for key, value in attributes.items():
-                span.set_attribute(key, value)
-        return span
\ No newline at end of file
+            span.set_attributes(attributes)
+        return span
@@ -1,27 +1,86 @@
 import yaml
 import json
-from typing import Dict, Any
+import os
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Union
 from pathlib import Path
+from pydantic import BaseModel
 
-def load_prompt(prompt_name: str) -> Dict[str, str]:
-    """Load prompt template from YAML file"""
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json when orjson is unavailable
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+_PROMPT_VARIABLE = re.compile(r"\{\{(\w+)\}\}")
+
+@lru_cache(maxsize=None)
+def load_prompt(prompt_name: str) -> Mapping[str, str]:
+    """Load prompt template from YAML file (parsed once per process, read-only since it is shared)"""
     prompt_path = Path(f"src/prompts/{prompt_name}.yaml")
-    with open(prompt_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    return MappingProxyType(yaml.load(prompt_path.read_bytes(), Loader=_YamlLoader))
+
+def dumps_json(data: Any) -> str:
+    """Serialize data to a JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, ensure_ascii=False)
+
+def loads_json(payload: Union[str, bytes]) -> Any:
+    """Parse a JSON string or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
 
-def render_prompt(template: str, variables: Dict[str, Any]) -> str:
-    """Render prompt template with variables using simple {{}} replacement"""
-    result = template
-    for key, value in variables.items():
-        result = result.replace(f"{{{{{key}}}}}", str(value))
-    return result
+class PromptTemplate:
+    """Prompt template split once into literal text and {{variable}} slots"""
+    def __init__(self, template: str):
+        # Odd indices hold variable names, even indices the literal text between them
+        self._parts = _PROMPT_VARIABLE.split(template)
+
+    def render(self, variables: Dict[str, Any]) -> str:
+        """Fill the template's variables, leaving unknown ones untouched"""
+        parts = self._parts[:]
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            parts[i] = str(variables[name]) if name in variables else f"{{{{{name}}}}}"
+        return "".join(parts)
+
+@lru_cache(maxsize=None)
+def compile_prompt(template: str) -> PromptTemplate:
+    """Compile a prompt template for repeated rendering"""
+    return PromptTemplate(template)
+
+def list_txt_files(directory: str) -> List[Path]:
+    """List the TXT files in a directory, sorted by name"""
+    # scandir reads names and types in one pass, without matching a glob per entry
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(".txt") and entry.is_file()
+        )
 
 def load_txt_file(file_path: str) -> str:
     """Load TXT file content with UTF-8 encoding"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    # One read and one C-level decode instead of text-mode incremental decoding
+    text = Path(file_path).read_bytes().decode('utf-8')
+    if "\r" in text:  # Match text mode's universal newline translation
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+def save_model_result(model: BaseModel, file_path: str) -> None:
+    """Save a Pydantic model as JSON file, serialized by pydantic-core"""
+    Path(file_path).write_text(model.model_dump_json(indent=2), encoding='utf-8')
 
 def save_json_result(data: Dict[str, Any], file_path: str) -> None:
     """Save result data as JSON file"""
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+    if orjson is not None:
+        Path(file_path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    Path(file_path).write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
\ No newline at end of file